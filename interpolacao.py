@@ -0,0 +1,684 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metodos de interpolacao numerica.
+"""
+
+from functools import lru_cache
+from itertools import product
+import warnings
+import numpy as np
+import scipy.sparse as sp
+from scipy.fft import dct
+from scipy.linalg import solve_banded
+from metodosRaizes import compila_expr
+
+__all__ = ['InterpoladorBaricentrico', 'InterpoladorNewton', 'SplineCubico',
+           'PCHIP', 'InterpoladorMalha', 'nos_chebyshev', 'AproximacaoChebyshev',
+           'aproxima_chebyshev']
+
+
+class InterpoladorBaricentrico:
+    """
+    Interpolacao de Lagrange na forma baricentrica (segunda forma):
+
+        p(x) = sum_j w_j y_j/(x - x_j) / sum_j w_j/(x - x_j)
+
+    Os pesos w_j = 1/prod_{k != j}(x_j - x_k) dependem apenas dos nos e
+    sao calculados uma unica vez, em O(n^2); cada avaliacao custa O(n)
+    por ponto e serve a quantos vetores Y se queira sobre os mesmos nos.
+
+    entrada:
+        X - nos de interpolacao, distintos (n,)
+        Y - valores nos nos (n,) ou (m x n), um conjunto por linha;
+            opcional, pode ser dado a cada avaliacao
+    bloco - numero maximo de pontos avaliados de uma vez (memoria)
+
+    uso:
+        p = InterpoladorBaricentrico(X,Y)
+        p(x)          # valores em x (array de qualquer forma)
+        p(x,Y2)       # mesmos nos (e pesos), outros valores
+    """
+
+    def __init__(self,X,Y=None,bloco=4096):
+        X = np.asarray(X,dtype=float).ravel()
+        if np.unique(X).size != X.size:
+            raise ValueError('Os nós de interpolação devem ser distintos.')
+
+        # produtos somados em escala logarítmica (evita under/overflow);
+        # os pesos só importam a menos de um fator comum
+        D = X[:,None] - X[None,:]
+        np.fill_diagonal(D,1)
+        L = np.log(np.abs(D)).sum(axis=1)
+        sinal = 1 - 2*((D < 0).sum(axis=1) % 2)
+
+        self.X = X
+        self.w = sinal*np.exp(L.min() - L)
+        self.Y = None if Y is None else np.asarray(Y)
+        self.bloco = bloco
+
+    def __call__(self,x,Y=None):
+        """
+        Avalia o interpolador em x.
+
+        entrada:
+            x - pontos de avaliacao (array de qualquer forma)
+            Y - valores nos nos (n,) ou (m x n); None usa os do construtor
+
+        saida:
+
+            y - valores interpolados: forma de x, ou (m,) + forma de x
+        """
+
+        Y = self.Y if Y is None else np.asarray(Y)
+        if Y is None:
+            raise ValueError('Informe os valores Y nos nós.')
+
+        x = np.asarray(x,dtype=float)
+        Ym = np.atleast_2d(Y)
+        xs = x.ravel()
+        y = np.empty((Ym.shape[0],xs.size),dtype=np.result_type(Ym,float))
+
+        for k in range(0,xs.size,self.bloco):
+            xb = xs[k:k+self.bloco]
+            D = xb[:,None] - self.X[None,:]
+
+            # pontos que coincidem com nós recebem o valor tabelado
+            exato = D == 0
+            D[exato] = 1
+            C = self.w/D
+            y[:,k:k+xb.size] = (Ym @ C.T)/C.sum(axis=1)
+
+            i, j = np.nonzero(exato)
+            y[:,k+i] = Ym[:,j]
+
+        return y.reshape(x.shape if Y.ndim == 1 else Ym.shape[:1] + x.shape)
+
+
+class InterpoladorNewton:
+    """
+    Interpolacao na forma de Newton, com a tabela de diferencas divididas
+    mantida entre chamadas:
+
+        p(x) = c_0 + c_1 (x - x_0) + ... + c_n (x - x_0)...(x - x_n-1)
+
+    Guardam-se os coeficientes c_k = f[x_0,...,x_k] (diagonal superior da
+    tabela) e a ultima linha f[x_n], f[x_n-1,x_n], ..., f[x_0,...,x_n];
+    com ela, cada novo no e acrescentado em O(n), sem refazer a tabela.
+
+    entrada:
+        X - nos iniciais, distintos (n,) (opcional)
+        Y - valores nos nos (n,)         (opcional)
+
+    uso:
+        p = InterpoladorNewton(X,Y)
+        p.adiciona(xn,yn)   # novo(s) no(s), O(n) cada
+        p(x)                # avaliacao aninhada (Horner), array de x
+    """
+
+    def __init__(self,X=(),Y=()):
+        X = np.asarray(X,dtype=float).ravel()
+        c = np.asarray(Y,dtype=float).ravel().copy()
+        if X.size != c.size:
+            raise ValueError('X e Y devem ter o mesmo tamanho.')
+
+        # tabela coluna a coluna, in loco: após a etapa j, c[i] (i >= j)
+        # guarda f[x_i-j,...,x_i], e c[-1] é o elemento j da última linha
+        ultima = c[-1:].copy()
+        for j in range(1,X.size):
+            c[j:] = (c[j:] - c[j-1:-1])/(X[j:] - X[:-j])
+            ultima = np.append(ultima,c[-1])
+
+        # armazenamento com capacidade dobrada a cada estouro (ver Traco)
+        cap = max(X.size,8)
+        self._X, self._c, self._u = np.zeros(cap), np.zeros(cap), np.zeros(cap)
+        self._X[:X.size], self._c[:X.size], self._u[:X.size] = X, c, ultima
+        self.n = X.size
+
+    def __len__(self):
+        return self.n
+
+    @property
+    def nos(self):
+        return self._X[:self.n]
+
+    @property
+    def coeficientes(self):
+        return self._c[:self.n]
+
+    def adiciona(self,x,y):
+        """
+        Acrescenta o(s) no(s) x com valor(es) y, em O(n) por no.
+
+        entrada:
+            x - novo(s) no(s), distinto(s) dos existentes (float ou array)
+            y - valor(es) correspondente(s)
+        """
+
+        for xk, yk in zip(np.ravel(x),np.ravel(y)):
+            n = self.n
+            if np.any(self._X[:n] == xk):
+                raise ValueError('Nó repetido: {0}'.format(xk))
+            if n == self._X.size:
+                self._X, self._c, self._u = [np.concatenate((v,np.zeros_like(v)))
+                                             for v in (self._X,self._c,self._u)]
+
+            # nova última linha: d_j = f[x_n-j+1,...,x_n+1]
+            X, u = self._X, self._u
+            d = float(yk)
+            for j in range(n):
+                d, u[j] = (d - u[j])/(xk - X[n-1-j]), d
+            u[n] = d
+
+            X[n], self._c[n] = xk, d
+            self.n += 1
+
+    def __call__(self,x):
+        """
+        Avalia o polinomio em x por multiplicacao aninhada.
+
+        entrada:
+            x - pontos de avaliacao (array de qualquer forma)
+
+        saida:
+
+            y - valores interpolados (forma de x)
+        """
+
+        x = np.asarray(x,dtype=float)
+        if self.n == 0:
+            raise ValueError('Interpolador sem nós.')
+
+        X, c = self.nos, self.coeficientes
+        y = np.full(x.shape,c[-1])
+        for k in range(self.n-2,-1,-1):
+            y = y*(x - X[k]) + c[k]
+        return y
+
+
+class _PorPartes:
+    """
+    Base dos interpoladores cubicos por partes: no intervalo
+    [X_i,X_i+1], com t = x - X_i,
+
+        s(t) = a_i + b_i t + c_i t^2 + d_i t^3
+
+    para cada conjunto de valores (linha de Y). Os coeficientes,
+    guardados em self.coef (4 x m x n-1), sao calculados uma unica vez;
+    fora de [X_0,X_n-1] extrapola-se com o polinomio do extremo.
+    """
+
+    def __init__(self,X,Y):
+        X = np.asarray(X,dtype=float).ravel()
+        Y = np.asarray(Y,dtype=float)
+        if X.size < 2 or np.any(np.diff(X) <= 0):
+            raise ValueError('X deve ser estritamente crescente, com ao menos 2 pontos.')
+        if Y.shape[-1] != X.size:
+            raise ValueError('Y deve ter um valor por nó (ultimo eixo).')
+
+        self.X = X
+        self.escalar = Y.ndim == 1
+        self.h = np.diff(X)
+        self.Y = np.atleast_2d(Y)
+        self.s = np.diff(self.Y,axis=1)/self.h
+
+    def _hermite(self,D):
+        """
+        Coeficientes a partir das derivadas D (m x n) nos nos.
+        """
+
+        h, s, Y = self.h, self.s, self.Y
+        c = (3*s - 2*D[:,:-1] - D[:,1:])/h
+        d = (D[:,:-1] + D[:,1:] - 2*s)/h**2
+        self.coef = np.stack((Y[:,:-1],D[:,:-1],c,d))
+
+    def localiza(self,x,ordenado=None):
+        """
+        Indice i do intervalo [X_i,X_i+1] de cada ponto de x, para reuso
+        em varias avaliacoes (e.g., varios campos sobre a mesma tabela).
+
+        Se x estiver ordenado, localizam-se os nos entre os pontos
+        (n buscas em x, O(n log p + p)) em vez de cada ponto entre os
+        nos (O(p log n)), o que compensa para p >> n.
+
+        entrada:
+            x - pontos de avaliacao (array de qualquer forma)
+     ordenado - se x e crescente; None verifica
+
+        saida:
+
+            i - indices dos intervalos (forma de x)
+        """
+
+        x = np.asarray(x,dtype=float)
+        xs = x.ravel()
+        n = self.X.size
+        if ordenado is None:
+            ordenado = xs.size > 1 and bool(np.all(xs[1:] >= xs[:-1]))
+
+        if ordenado:
+            pos = np.searchsorted(xs,self.X[1:-1],side='left')
+            i = np.cumsum(np.bincount(pos,minlength=xs.size+1)[:xs.size])
+        else:
+            i = np.clip(np.searchsorted(self.X,xs,side='right') - 1,0,n-2)
+        return i.reshape(x.shape)
+
+    def __call__(self,x,indices=None):
+        """
+        Avalia o interpolador em x.
+
+        entrada:
+            x - pontos de avaliacao (array de qualquer forma)
+      indices - intervalos ja localizados (ver localiza), ou None
+
+        saida:
+
+            y - valores interpolados: forma de x, ou (m,) + forma de x
+        """
+
+        x = np.asarray(x,dtype=float)
+        i = self.localiza(x) if indices is None else np.asarray(indices)
+        t = x - self.X[i]
+        a, b, c, d = (np.take(k,i,axis=1) for k in self.coef)
+
+        # Horner in loco (menos temporários para lotes grandes)
+        y = d*t
+        y += c
+        y *= t
+        y += b
+        y *= t
+        y += a
+        return y[0] if self.escalar else y
+
+
+class SplineCubico(_PorPartes):
+    """
+    Spline cubico interpolador (classe C2), com condicoes de contorno
+    naturais (s'' = 0 nos extremos) ou fixadas (s' dado nos extremos).
+    As segundas derivadas nos nos vem de um unico sistema tridiagonal,
+    resolvido em O(n) (armazenamento em banda) para todas as linhas de Y.
+
+    entrada:
+        X - nos, estritamente crescentes (n,)
+        Y - valores (n,) ou (m x n), um conjunto por linha
+ contorno - 'natural' ou 'fixado'
+ derivadas - (s'(X_0), s'(X_n-1)) para contorno 'fixado'
+
+    uso:
+        s = SplineCubico(T,h)
+        i = s.localiza(t)      # opcional: reuso da busca
+        s(t,i)
+    """
+
+    def __init__(self,X,Y,contorno='natural',derivadas=(0,0)):
+        super().__init__(X,Y)
+        if contorno not in ('natural','fixado'):
+            raise ValueError("contorno deve ser 'natural' ou 'fixado'.")
+
+        h, s = self.h, self.s
+        n = self.X.size
+
+        # sistema em M (segundas derivadas): ab em banda (sup., diag., inf.)
+        ab = np.zeros((3,n))
+        R = np.zeros((n,s.shape[0]))
+        ab[0,2:] = h[1:]
+        ab[1,1:-1] = 2*(h[:-1] + h[1:])
+        ab[2,:-2] = h[:-1]
+        R[1:-1] = 6*(s[:,1:] - s[:,:-1]).T
+
+        if contorno == 'natural':
+            ab[1,[0,-1]] = 1
+        else:
+            d0, dn = derivadas
+            ab[1,0], ab[0,1] = 2*h[0], h[0]
+            ab[1,-1], ab[2,-2] = 2*h[-1], h[-1]
+            R[0] = 6*(s[:,0] - d0)
+            R[-1] = 6*(dn - s[:,-1])
+
+        M = solve_banded((1,1),ab,R).T
+
+        # derivadas primeiras nos nós e coeficientes de Hermite
+        D = np.empty_like(M)
+        D[:,:-1] = s - h*(2*M[:,:-1] + M[:,1:])/6
+        D[:,-1] = s[:,-1] + h[-1]*(M[:,-2] + 2*M[:,-1])/6
+        self._hermite(D)
+
+
+class PCHIP(_PorPartes):
+    """
+    Interpolacao cubica de Hermite monotona por partes (Fritsch-Carlson):
+    as derivadas nos nos sao medias harmonicas ponderadas das inclinacoes
+    vizinhas (nulas nos extremos locais), o que preserva a monotonia dos
+    dados e evita oscilacoes.
+
+    entrada:
+        X - nos, estritamente crescentes (n,)
+        Y - valores (n,) ou (m x n), um conjunto por linha
+    """
+
+    def __init__(self,X,Y):
+        super().__init__(X,Y)
+
+        h, s = self.h, self.s
+        D = np.zeros((s.shape[0],self.X.size))
+        if self.X.size == 2:
+            D[:] = s
+            self._hermite(D)
+            return
+
+        # nós interiores: média harmônica ponderada onde não há extremo
+        w1, w2 = 2*h[1:] + h[:-1], h[1:] + 2*h[:-1]
+        s0, s1 = s[:,:-1], s[:,1:]
+        mesmo = s0*s1 > 0
+        with np.errstate(divide='ignore',invalid='ignore'):
+            D[:,1:-1] = np.where(mesmo,(w1 + w2)/(w1/s0 + w2/s1),0)
+
+        # extremos: fórmula de três pontos, limitada para manter a forma
+        for k, (ha, hb, sa, sb) in ((0,(h[0],h[1],s[:,0],s[:,1])),
+                                    (-1,(h[-1],h[-2],s[:,-1],s[:,-2]))):
+            d = ((2*ha + hb)*sa - ha*sb)/(ha + hb)
+            d = np.where(np.sign(d) != np.sign(sa),0,d)
+            d = np.where((np.sign(sa) != np.sign(sb)) & (np.abs(d) > 3*np.abs(sa)),
+                         3*sa,d)
+            D[:,k] = d
+
+        self._hermite(D)
+
+
+def _pesos_eixo(eixo,q,metodo):
+    """
+    Indices (p x k) e pesos (p x k) dos nos de um eixo que entram na
+    interpolacao em q: k = 2 (linear) ou 4 (convolucao cubica de Keys,
+    a = -1/2). Fora do eixo, repete-se o valor do extremo.
+    """
+
+    n = eixo.size
+    i = np.clip(np.searchsorted(eixo,q,side='right') - 1,0,n-2)
+    t = np.clip((q - eixo[i])/(eixo[i+1] - eixo[i]),0,1)
+
+    if metodo == 'linear':
+        return np.stack((i,i+1),axis=-1), np.stack((1 - t,t),axis=-1)
+
+    t2, t3 = t*t, t*t*t
+    W = np.stack(((-t3 + 2*t2 - t)/2,(3*t3 - 5*t2 + 2)/2,
+                  (-3*t3 + 4*t2 + t)/2,(t3 - t2)/2),axis=-1)
+
+    # nós fantasmas nos extremos, f_-1 = 3 f_0 - 3 f_1 + f_2 (e
+    # simétrico), redistribuídos sobre o estêncil: mantém a ordem cúbica
+    for borda, (g, a, b, c) in ((i == 0,(0,1,2,3)),(i == n-2,(3,2,1,0))):
+        wg = np.where(borda,W[...,g],0)
+        W[...,g] -= wg
+        W[...,a] += 3*wg
+        W[...,b] -= 3*wg
+        W[...,c] += wg
+    I = np.clip(i[...,None] + np.arange(-1,3),0,n-1)
+    return I, W
+
+
+class InterpoladorMalha:
+    """
+    Interpolacao por produto tensorial (bi/trilinear ou bi/tricubica)
+    de campos amostrados em uma malha retangular dada pelos seus eixos,
+    sem montar np.meshgrid: cada eixo e tratado separadamente e as
+    buscas por eixo (indices e pesos) podem ser reutilizadas para
+    todos os campos sobre a mesma malha.
+
+    entrada:
+     eixos - coordenadas crescentes de cada eixo (tupla de arrays), i.e.,
+             os argumentos que seriam passados a np.meshgrid(..., indexing='ij')
+    metodo - 'linear' ou 'cubico' (convolucao cubica; eixos uniformes)
+
+    Os campos F tem forma (n_0,...,n_d-1), ou (m,n_0,...,n_d-1) para m
+    campos de uma vez.
+
+    uso:
+        I = InterpoladorMalha((x,y),'cubico')
+        loc = I.localiza(P)        # P (p x d): nuvem de pontos
+        I(F,loc), I(G,loc)         # campos sobre a mesma malha
+        I.reamostra(F,(xn,yn))     # nova malha, tambem sem meshgrid
+    """
+
+    def __init__(self,eixos,metodo='linear'):
+        if metodo not in ('linear','cubico'):
+            raise ValueError("metodo deve ser 'linear' ou 'cubico'.")
+
+        self.eixos = tuple(np.asarray(e,dtype=float).ravel() for e in eixos)
+        for e in self.eixos:
+            h = np.diff(e)
+            if e.size < 2 or np.any(h <= 0):
+                raise ValueError('Os eixos devem ser estritamente crescentes, com ao menos 2 pontos.')
+            if metodo == 'cubico' and (e.size < 3 or not np.allclose(h,h[0])):
+                raise ValueError("O método 'cubico' exige eixos uniformes, com ao menos 3 pontos.")
+        self.metodo = metodo
+        self.forma = tuple(e.size for e in self.eixos)
+
+    def localiza(self,pontos):
+        """
+        Buscas por eixo para uma nuvem de pontos.
+
+        entrada:
+            pontos - coordenadas (p x d) (array ou lista de pontos), ou
+                     tupla de d arrays de mesma forma, um por eixo
+
+        saida:
+
+               loc - tupla (por eixo) de pares (indices, pesos), para
+                     reuso em __call__
+        """
+
+        # só tuplas são lidas por eixo; listas são listas de pontos
+        if isinstance(pontos,tuple):
+            Q = [np.asarray(q,dtype=float) for q in pontos]
+        else:
+            pontos = np.asarray(pontos,dtype=float)
+            Q = [pontos[...,a] for a in range(pontos.shape[-1])]
+        if len(Q) != len(self.eixos):
+            raise ValueError('Os pontos devem ter uma coordenada por eixo.')
+
+        return tuple(_pesos_eixo(e,q,self.metodo) for e, q in zip(self.eixos,Q))
+
+    def __call__(self,F,pontos=None,loc=None):
+        """
+        Interpola F em uma nuvem de pontos.
+
+        entrada:
+            F - campo(s) na malha: (n_0,...) ou (m,n_0,...)
+       pontos - coordenadas (ver localiza), se loc nao for dado
+          loc - buscas ja feitas por localiza
+
+        saida:
+
+            y - valores: forma da nuvem, ou (m,) + forma da nuvem
+        """
+
+        F = np.asarray(F)
+        if loc is None:
+            loc = self.localiza(pontos)
+        d = len(self.eixos)
+        if F.shape[-d:] != self.forma:
+            raise ValueError('F deve ter a forma da malha {0}.'.format(self.forma))
+
+        # soma sobre os k^d nós do estêncil tensorial
+        y = 0
+        k = loc[0][0].shape[-1]
+        for js in product(range(k),repeat=d):
+            w = np.prod([W[...,j] for (I, W), j in zip(loc,js)],axis=0)
+            y = y + w*F[(...,) + tuple(I[...,j] for (I, W), j in zip(loc,js))]
+        return y
+
+    def matrizes(self,novos_eixos):
+        """
+        Matrizes esparsas (q_a x n_a) de interpolacao de cada eixo para
+        os eixos de uma nova malha (reuso em reamostra).
+        """
+
+        M = []
+        for e, q in zip(self.eixos,novos_eixos):
+            I, W = _pesos_eixo(e,np.asarray(q,dtype=float).ravel(),self.metodo)
+            lin = np.repeat(np.arange(I.shape[0]),I.shape[1])
+            M.append(sp.csr_array((W.ravel(),(lin,I.ravel())),shape=(I.shape[0],e.size)))
+        return M
+
+    def reamostra(self,F,novos_eixos=None,matrizes=None):
+        """
+        Interpola F em outra malha retangular, eixo por eixo (aplicacao
+        separavel das matrizes de cada eixo), sem montar meshgrids.
+
+        entrada:
+            F - campo(s) na malha: (n_0,...) ou (m,n_0,...)
+  novos_eixos - eixos da nova malha (tupla de arrays)
+     matrizes - matrizes ja calculadas (ver matrizes), se dadas
+
+        saida:
+
+            G - campo(s) na nova malha: (q_0,...) ou (m,q_0,...)
+        """
+
+        if matrizes is None:
+            matrizes = self.matrizes(novos_eixos)
+        G = np.asarray(F)
+        d = len(self.eixos)
+        if G.shape[-d:] != self.forma:
+            raise ValueError('F deve ter a forma da malha {0}.'.format(self.forma))
+
+        for a, M in enumerate(matrizes):
+            eixo = G.ndim - d + a
+            G = np.moveaxis(G,eixo,0)
+            forma = G.shape
+            G = (M @ G.reshape(forma[0],-1)).reshape((M.shape[0],) + forma[1:])
+            G = np.moveaxis(G,0,eixo)
+        return G
+
+
+def nos_chebyshev(n,a=-1,b=1):
+    """
+    Pontos de Chebyshev (extremos de T_n, x_k = cos(k pi/n), k = 0..n),
+    levados de [-1,1] para [a,b], em ordem decrescente.
+    """
+
+    return (a + b)/2 + (b - a)/2*np.cos(np.pi*np.arange(n+1)/n)
+
+
+class AproximacaoChebyshev:
+    """
+    Aproximacao de f em [a,b] pela serie de Chebyshev truncada
+
+        p(x) = sum_k c_k T_k(t),   t = (2x - a - b)/(b - a),
+
+    interpolante nos pontos de Chebyshev (sem o fenomeno de Runge dos
+    nos igualmente espacados). Os coeficientes vem de uma DCT-I das
+    amostras, em O(n log n); o grau e escolhido adaptativamente,
+    dobrando n (os pontos antigos sao reaproveitados) ate que a cauda
+    dos coeficientes caia abaixo de tol*max|c_k|. A avaliacao usa a
+    recorrencia de Clenshaw.
+
+    entrada:
+        f - funcao vetorizada f(x), ou string em x (ver compila_expr);
+            None com coef dado
+      a,b - intervalo de aproximacao
+      tol - tolerancia relativa sobre os coeficientes
+     nmax - grau maximo (potencia de 2); se atingido sem convergencia,
+            emite RuntimeWarning (e convergiu = False)
+     coef - coeficientes ja conhecidos (dispensa f)
+
+    uso:
+        p = AproximacaoChebyshev('exp(-x**2)*cos(5*x)',-2,2)
+        p(x), p.grau, p.coef
+    """
+
+    def __init__(self,f=None,a=-1,b=1,tol=1e-14,nmax=2**16,coef=None):
+        self.a, self.b = float(a), float(b)
+        if coef is not None:
+            self.coef = np.asarray(coef,dtype=float)
+            self.convergiu = True
+            return
+
+        if isinstance(f,str):
+            f = compila_expr(f)
+
+        # amostras com a forma dos nós (f constante pode retornar escalar)
+        def amostra(x):
+            return np.broadcast_to(np.asarray(f(x),dtype=float),x.shape)
+
+        n = 16
+        y = amostra(nos_chebyshev(n,a,b))
+        while True:
+            c = dct(y,type=1)/n
+            c[[0,-1]] /= 2
+
+            # cauda desprezível: os últimos coeficientes abaixo da tolerância
+            escala = np.abs(c).max()
+            cauda = np.abs(c[-max(3,n//16):]).max()
+            self.convergiu = cauda <= tol*escala or escala == 0
+            if self.convergiu:
+                break
+            if n >= nmax:
+                warnings.warn('AproximacaoChebyshev: tolerância {0:g} não atingida com '
+                              'grau nmax = {1} ({2} avaliações de f); cauda relativa '
+                              '{3:.1e}.'.format(tol,n,n+1,cauda/escala),
+                              RuntimeWarning,stacklevel=2)
+                break
+
+            # pontos de 2n: os de n (índices pares) mais os novos (ímpares)
+            novos = nos_chebyshev(2*n,a,b)[1::2]
+            y2 = np.empty(2*n+1)
+            y2[::2], y2[1::2] = y, amostra(novos)
+            y, n = y2, 2*n
+
+        # corta os coeficientes finais desprezíveis
+        k = np.flatnonzero(np.abs(c) > tol*escala)
+        self.coef = c[:k[-1]+1] if k.size else c[:1]
+
+    @property
+    def grau(self):
+        return self.coef.size - 1
+
+    def __repr__(self):
+        return 'AproximacaoChebyshev([{0}, {1}], grau={2})'.format(self.a,self.b,self.grau)
+
+    def __call__(self,x):
+        """
+        Avalia a aproximacao em x (float ou array) por Clenshaw.
+        """
+
+        a, b, c = self.a, self.b, self.coef
+
+        # escalar: laço em floats, sem o custo fixo das operações com arrays
+        if np.ndim(x) == 0:
+            t = (2*float(x) - a - b)/(b - a)
+            t2 = 2*t
+            b1 = b2 = 0.0
+            for ck in c[:0:-1].tolist():
+                b1, b2 = ck + t2*b1 - b2, b1
+            return c[0] + t*b1 - b2
+
+        t = (2*np.asarray(x,dtype=float) - a - b)/(b - a)
+        t2 = 2*t
+        b1 = b2 = np.zeros_like(t)
+        for ck in c[:0:-1]:
+            b1, b2 = ck + t2*b1 - b2, b1
+        return c[0] + t*b1 - b2
+
+
+@lru_cache(maxsize=128)
+def aproxima_chebyshev(f,a=-1,b=1,tol=1e-14):
+    """
+    AproximacaoChebyshev com cache (LRU) indexado por (f,a,b,tol): o
+    substituto de uma funcao cara e ajustado uma unica vez, e as chamadas
+    seguintes apenas o avaliam. Contadores em aproxima_chebyshev.cache_info().
+
+    entrada:
+        f - funcao (hashable) ou string em x
+      a,b - intervalo de aproximacao
+      tol - tolerancia relativa sobre os coeficientes
+
+    saida:
+
+        p - AproximacaoChebyshev
+    """
+
+    return AproximacaoChebyshev(f,a,b,tol)
+
+
+if __name__ == '__main__':
+    None
@@ -6,13 +6,205 @@ Created on Wed Aug  8 22:10:55 2018
 @author: gustavo
 """
 
-import inspect, re
-from numpy import *
-from matplotlib.pyplot import plot, legend
+import ast
+import builtins
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+import numpy as np
+
+# matplotlib é importado sob demanda em _visualiza (vis=True), de modo que
+# o módulo carrega sem ele (e.g., processos sem interface gráfica)
+
+__all__ = ['compila_expr', 'FuncaoMemo', 'Traco', 'TRACO_DTYPE', 'renderiza_traco',
+           'bissecao', 'bissecao_vet', 'falsa_posicao', 'newton',
+           'newton_vet', 'ponto_fixo', 'secante', 'brent', 'illinois',
+           'todas_raizes', 'muller_vet', 'raizes_polinomio', 'ponto_fixo_vet']
+
+
+# espaço de nomes usado para avaliar as expressões em string
+_NAMESPACE = dict(vars(np))
+_NAMESPACE.update({'np': np, 'numpy': np})
+_EMBUTIDOS = set(dir(builtins))
+
+
+@lru_cache(maxsize=256)
+def compila_expr(f,var='x'):
+    """
+    Compila uma expressao em string para uma funcao vetorizada (numpy),
+    validando as variaveis livres. O resultado fica em cache (LRU),
+    indexado por (f,var); contadores em compila_expr.cache_info().
+
+    entrada:
+        f - expressao (str)     (e.g., 'x**2*cos(x)', 'np.exp(-c*t)')
+      var - variavel(is) (str)  (e.g., 'x' ou 'x,p')
+
+    saida:
+
+        funcao anonima de var   (callable)
+    """
+
+    args = [v.strip() for v in var.split(',') if v.strip()]
+
+    try:
+        arvore = ast.parse(f.strip(),mode='eval')
+    except SyntaxError as err:
+        raise ValueError('Expressão inválida: {0}'.format(f)) from err
+
+    # nomes ligados na própria expressão (compreensões, lambdas, :=)
+    ligados = {no.id for no in ast.walk(arvore)
+               if isinstance(no,ast.Name) and isinstance(no.ctx,ast.Store)}
+    ligados |= {no.arg for no in ast.walk(arvore) if isinstance(no,ast.arg)}
+
+    # nomes que não são variáveis, nem funções/constantes do numpy,
+    # nem embutidos do Python (visíveis ao eval, como no import *)
+    nomes = {no.id for no in ast.walk(arvore) if isinstance(no,ast.Name)}
+    livres = sorted(nomes - ligados - set(args) - set(_NAMESPACE) - _EMBUTIDOS)
+    if livres:
+        raise ValueError('Variáveis livres não declaradas em {0}: {1}'
+                         .format(f,', '.join(livres)))
+
+    return eval('lambda ' + ','.join(args) + ' :' + f,_NAMESPACE)
+
+
+
+class FuncaoMemo:
+    """
+    Envolve uma funcao escalar com cache limitado (LRU) e contador:
+    cada x distinto e avaliado uma unica vez enquanto estiver no cache.
+
+    entrada:
+        f - funcao f(x)
+  tamanho - numero maximo de pontos guardados (int)
+
+    O atributo avaliacoes conta as chamadas efetivas a f. Arrays
+    (e.g., na plotagem) nao passam pelo cache, mas sao contados
+    ponto a ponto.
+    """
+
+    def __init__(self,f,tamanho=64):
+        self.f = f
+        self.tamanho = tamanho
+        self.cache = OrderedDict()
+        self.avaliacoes = 0
+
+    def __call__(self,x):
+        if np.ndim(x) > 0:
+            self.avaliacoes += np.size(x)
+            return self.f(x)
+
+        # array 0-d não é hashable: usa o escalar como chave
+        if isinstance(x,np.ndarray):
+            x = x.item()
+
+        if x in self.cache:
+            self.cache.move_to_end(x)
+            return self.cache[x]
+
+        fx = self.f(x)
+        self.avaliacoes += 1
+        self.cache[x] = fx
+        if len(self.cache) > self.tamanho:
+            self.cache.popitem(last=False)
+        return fx
+
+# registro de uma iteração: (i, x, f(x), erro)
+TRACO_DTYPE = np.dtype([('i',np.int64),('x',np.float64),
+                        ('fx',np.float64),('erro',np.float64)])
+
+
+class Traco:
+    """
+    Registro pre-alocado das iteracoes de um metodo de raizes.
+
+    entrada:
+        N - numero esperado de linhas   (int)
+
+    As linhas (i, x, fx, erro) sao gravadas em um array estruturado,
+    que dobra de tamanho se N for excedido; use .registro para obte-lo.
+    """
+
+    def __init__(self,N):
+        self.dados = np.zeros(N,dtype=TRACO_DTYPE)
+        self.n = 0
+
+    def __call__(self,i,x,fx,e):
+        if self.n == self.dados.size:
+            self.dados = np.concatenate((self.dados,np.zeros_like(self.dados)))
+        self.dados[self.n] = (i,x,fx,e)
+        self.n += 1
+
+    @property
+    def registro(self):
+        return self.dados[:self.n]
+
+
+def renderiza_traco(registro):
+    """
+    Imprime um registro de iteracoes (ver Traco) como tabela.
+
+    entrada:
+        registro - array estruturado com campos i, x, fx, erro
+    """
+
+    print('i\t x\t\t f(x)\t\t ER')
+    for i,x,fx,e in registro:
+        print('{0:d}\t {1:f}\t {2:f}\t {3:e}'.format(i,x,fx,e))
+
+
+def _inicia_traco(trace,N):
+    """
+    Retorna o gancho de registro para o modo trace ou None (desligado).
+    """
+
+    if trace is None or trace == 'off':
+        return None
+    if callable(trace):
+        return trace
+    if trace in ('tabela','registro'):
+        return Traco(N+2)
+    raise ValueError("trace deve ser None, 'off', 'tabela', 'registro' ou uma função.")
+
+
+def _encerra_traco(trace,tr,x,msg,info=None):
+    """
+    Renderiza a tabela (modo 'tabela') ou anexa o registro ao
+    retorno (modo 'registro'); se dado, info (dict) e anexado ao final.
+    """
+
+    saida = (x,)
+    if trace == 'tabela':
+        renderiza_traco(tr.registro)
+        print(msg.format(x))
+    elif trace == 'registro':
+        saida += (tr.registro,)
+    if info is not None:
+        saida += (info,)
+    return saida if len(saida) > 1 else x
+
+
+def _visualiza(x,f,g=None):
+    """
+    Plota f (e, se dada, a funcao de iteracao g) na vizinhanca da raiz x.
+    O matplotlib e importado apenas aqui.
+    """
+
+    from matplotlib.pyplot import plot, legend
+
+    dx = 2*x
+    dom = np.linspace(x - dx,x + dx,30)
+    plot(dom,f(dom),label='$f(x)$')
+    if g is None:
+        plot(x,f(x),'ro')
+    else:
+        plot(dom,dom*0,label='$y=0$')
+        plot(dom,g(dom),label='$g(x)$')
+        plot(dom,dom,label='$y=x$')
+        legend()
 
 
 # Método da Bissecao
-def bissecao(f,a,b,tol,N,var):
+def bissecao(f,a,b,tol,N,var,trace='tabela',info=False):
     """
     Metodo da bissecao para funcoes unidimensionais
 
@@ -23,26 +215,26 @@ def bissecao(f,a,b,tol,N,var):
         b - limite superior do dominio
       tol - tolerancia    
         N - numero maximo de iteracoes
+      var - variavel da funcao (str)
+    trace - modo de registro das iteracoes:
+            None/'off' (desligado), 'tabela' (imprime ao final),
+            'registro' (retorna tambem o array de Traco) ou
+            funcao gancho(i,x,fx,erro)
+     info - se True, retorna tambem dict com iteracoes e avaliacoes
 
     saida: 
     
        xm - raiz da funcao
 """
         
-    # TODO identificar a variável usada na função 
-    #      Aqui, tentei assumir que apenas uma era usada (e.g. 'x'),
-    #      mas foi complicado generalizar quando há objeto numpy
-    #var = re.search('[a-zA-Z]+',f)
-    #var = var.group()
-
-    # cria função anônima
-    f = eval('lambda ' + var + ' :' + f)
-
     # Se função não for de uma variável, lança erro.
-    # Mais aplicável se o caso geral fosse implementado.        
-    if len(inspect.getfullargspec(f).args) - 1 > 0:    
+    if len(var.split(',')) > 1:
         raise ValueError('O código é válido apenas para uma variável.')
 
+    # cria função anônima (compilada uma única vez por expressão),
+    # com cache dos valores já avaliados
+    f = FuncaoMemo(compila_expr(f,var))
+
     # calcula valor da função nos extremos
     fa = f(a) 
     fb = f(b)
@@ -56,6 +248,9 @@ def bissecao(f,a,b,tol,N,var):
     # suficientemente reduzido
     done = 0;
 
+    # registro das iterações
+    tr = _inicia_traco(trace,N)
+
     # loop principal
 
     # bisecta o intervalo
@@ -67,7 +262,8 @@ def bissecao(f,a,b,tol,N,var):
     # avalia a função no ponto médio
         fxm = f(xm)
         
-        print("i={0:d} a={1:f} b={2:f} xm={3:f} f(a)={4:f} f(b)={5:f} f(xm)={6:f} b-a={7:f}".format(i,a,b,xm,fa,fb,fxm,abs(a-b)))
+        if tr is not None:
+            tr(i,xm,fxm,abs(a-b))
    
         if fa*fxm < 0:       # Raiz esta à esquerda de xm
             b = xm
@@ -83,27 +279,108 @@ def bissecao(f,a,b,tol,N,var):
         N -= 1              # Atualiza passo
         i += 1              # Atualiza contador
    
-    print("i={0:d} a={1:f} b={2:f} xm={3:f} f(a)={4:f} f(b)={5:f} f(xm)={6:f} b-a={7:f}".format(i,a,b,xm,fa,fb,f(xm),abs(a-b)))
-    print("Solução encontrada: {0}".format(xm))
+    if tr is not None:
+        tr(i,xm,f(xm),abs(a-b))
 
-    return xm
+    return _encerra_traco(trace,tr,xm,'Solução encontrada: {0}',
+                          {'iteracoes': i-1, 'avaliacoes': f.avaliacoes} if info else None)
 
-def falsa_posicao(f,a,b,tol,N,var):
-        
-    # TODO identificar a variável usada na função 
-    #      Aqui, tentei assumir que apenas uma era usada (e.g. 'x'),
-    #      mas foi complicado generalizar quando há objeto numpy
-    #var = re.search('[a-zA-Z]+',f)
-    #var = var.group()
 
-    # cria função anônima
-    f = eval('lambda ' + var + ' :' + f)
+def bissecao_vet(f,a,b,tol,N,var='x',args=()):
+    """
+    Metodo da bissecao vetorizado: resolve varios intervalos
+    simultaneamente, em passo sincronizado, retirando as
+    "faixas" (lanes) que ja convergiram.
+
+    entrada:
+        f - string dependendo de var (e.g., 'x**2 - p') ou
+            funcao f(x,*args) vetorizada (numpy)
+        a - limites inferiores          (array ou float)
+        b - limites superiores          (array ou float)
+      tol - tolerancia sobre |b - a|, relativa a max(1,|x|) (float)
+        N - numero maximo de iteracoes  (int)
+      var - variavel(is) da string f    (str; e.g. 'x' ou 'x,p')
+     args - parametros por faixa        (tupla de arrays ou floats)
+
+    saida:
+
+       xm - raizes aproximadas          (array)
+       it - iteracoes por faixa         (array de int)
+     conv - flag de convergencia        (array de bool)
+
+    Faixas sem troca de sinal em [a,b] nao sao iteradas:
+    recebem xm = nan, it = 0 e conv = False.
+    """
+
+    if isinstance(f,str):
+        f = compila_expr(f,var)
+
+    # difunde limites e parametros para um formato comum
+    arrs = np.broadcast_arrays(np.asarray(a,dtype=float),
+                               np.asarray(b,dtype=float),
+                               *[np.asarray(p) for p in args])
+    shape = arrs[0].shape
+    a, b = arrs[0].ravel().copy(), arrs[1].ravel().copy()
+    args = [p.ravel() for p in arrs[2:]]
+
+    n = a.size
+    xm = np.full(n,np.nan)
+    it = np.zeros(n,dtype=int)
+    conv = np.zeros(n,dtype=bool)
+
+    # calcula valor da função nos extremos
+    fa = f(a,*args)
+    fb = f(b,*args)
+
+    # apenas faixas com troca de sinal são iteradas
+    idx = np.flatnonzero(fa*fb < 0)
+    a, b, fa = a[idx], b[idx], fa[idx]
+    args = [p[idx] for p in args]
+
+    i = 0 # contador
+    while idx.size > 0 and i < N:
+        i += 1
+
+        # bisecta os intervalos ativos e avalia a função
+        x = (a+b)/2
+        fx = f(x,*args)
+        xm[idx] = x
+        it[idx] = i
+
+        # raiz à esquerda ou à direita de x
+        esq = fa*fx < 0
+        b = np.where(esq,x,b)
+        a = np.where(esq,a,x)
+        fa = np.where(esq,fa,fx)
+
+        # retira faixas convergidas: intervalo pequeno em relação a |x|,
+        # já na resolução do ponto flutuante (ponto médio igual a um
+        # extremo) ou raiz exata; |f(x)| pequeno, sozinho, não basta
+        xn = (a+b)/2
+        ok = ((np.abs(b-a) < tol*np.maximum(1,np.abs(x)))
+              | (xn == a) | (xn == b) | (fx == 0))
+        conv[idx[ok]] = True
+        ativo = ~ok
+        idx, a, b, fa = idx[ativo], a[ativo], b[ativo], fa[ativo]
+        args = [p[ativo] for p in args]
+
+    return xm.reshape(shape), it.reshape(shape), conv.reshape(shape)
+
+
+def falsa_posicao(f,a,b,tol,N,var,trace='tabela',info=False):
+    """
+    Metodo da falsa posicao para funcoes unidimensionais.
+    Entradas e saida como em bissecao.
+    """
 
     # Se função não for de uma variável, lança erro.
-    # Mais aplicável se o caso geral fosse implementado.        
-    if len(inspect.getfullargspec(f).args) - 1 > 0:    
+    if len(var.split(',')) > 1:
         raise ValueError('O código é válido apenas para uma variável.')
 
+    # cria função anônima (compilada uma única vez por expressão),
+    # com cache dos valores já avaliados
+    f = FuncaoMemo(compila_expr(f,var))
+
     # calcula valor da função nos extremos
     fa = f(a) 
     fb = f(b)
@@ -117,6 +394,9 @@ def falsa_posicao(f,a,b,tol,N,var):
     # suficientemente reduzido
     done = 0;
 
+    # registro das iterações
+    tr = _inicia_traco(trace,N)
+
     # loop principal
 
     # bisecta o intervalo
@@ -127,7 +407,8 @@ def falsa_posicao(f,a,b,tol,N,var):
     while abs(a-b) >= tol and abs(f(xm)) >= tol and ( not done or N != 0 ):
     # avalia a função no ponto médio
         fxm = f(xm)
-        print("i={0:d} a={1:f} b={2:f} xm={3:f} f(a)={4:f} f(b)={5:f} f(xm)={6:f} b-a={7:f}".format(i,a,b,xm,fa,fb,fxm,abs(a-b)))
+        if tr is not None:
+            tr(i,xm,fxm,abs(a-b))
         
         if fa*fxm < 0:       # Raiz esta à esquerda de xm
             b = xm
@@ -143,13 +424,14 @@ def falsa_posicao(f,a,b,tol,N,var):
         N -= 1              # Atualiza passo
         i += 1              # Atualiza contador
             
-    print("i={0:d} a={1:f} b={2:f} xm={3:f} f(a)={4:f} f(b)={5:f} f(xm)={6:f} b-a={7:f}".format(i,a,b,xm,fa,fb,f(xm),abs(a-b)))    
-    print("Solução encontrada: {0}".format(xm))
+    if tr is not None:
+        tr(i,xm,f(xm),abs(a-b))
 
-    return xm
+    return _encerra_traco(trace,tr,xm,'Solução encontrada: {0}',
+                          {'iteracoes': i-1, 'avaliacoes': f.avaliacoes} if info else None)
 
    
-def newton(x0,f,df,tol,N,vis):
+def newton(x0,f,df,tol,N,vis,trace='tabela',info=False):
     """ 
     Resolve problema de determinacao de raizes pelo 
     metodo de Newton.
@@ -162,22 +444,27 @@ def newton(x0,f,df,tol,N,vis):
        tol - tolerancia                 (float)       
          N - numero maximo de iteracoes (int)
       vis  - flag para plotagem         (bool)
+     trace - modo de registro das iteracoes:
+             None/'off' (desligado), 'tabela' (imprime ao final),
+             'registro' (retorna tambem o array de Traco) ou
+             funcao gancho(i,x,fx,erro)
+      info - se True, retorna tambem dict com iteracoes e avaliacoes
       
     saida:  
     
        x   - raiz aproximada para f     (float)      
     """
   
-    f = eval('lambda x:' + f)
-    df = eval('lambda x:' + df)
+    f = FuncaoMemo(compila_expr(f))
+    df = FuncaoMemo(compila_expr(df))
 
-    # imprime estimativa inicial
-    print('Estimativa inicial: x0 = {0}\n'.format(x0))  
+    # registro das iterações
+    tr = _inicia_traco(trace,N)
+    if tr is not None:
+        tr(0,x0,f(x0),np.nan)
+
+    conv = False
 
-    # tabela
-    print('i\t x\t\t f(x)\t\t df(x)\t\t ER')  
-    print('{0:d}\t {1:f}\t {2:f}\t {3:f}\t -'.format(0,x0,f(x0),df(x0)))       
-    
     # Loop 
     for i in range(0,N):
         
@@ -185,28 +472,113 @@ def newton(x0,f,df,tol,N,vis):
         
         e = abs(x-x0)/abs(x) # erro
         
-        # tabela
-        print('{0:d}\t {1:f}\t {2:f}\t {3:f}\t {4:e}'.format(i+1,x,f(x),df(x),e))       
+        if tr is not None:
+            tr(i+1,x,f(x),e)
         
         if e < tol and abs(f(x)) < tol:
+            conv = True
             break
         x0 = x                
         
-    if i == N:
-        print('Solução não obtida em {0:d} iterações'.format(N))
+    if conv:
+        msg = 'Solução obtida: x = {0:.10f}'
     else:
-        print('Solução obtida: x = {0:.10f}'.format(x))
+        msg = 'Solução não obtida em {0:d} iterações'.format(N)
 
     # plotagem
     if vis == True:        
-        dx = 2*x
-        dom = linspace(x - dx,x + dx,30)
-        plot(dom,f(dom),label='$f(x)$')
-        plot(x,f(x),'ro')
+        _visualiza(x,f)
 
-    return x
+    return _encerra_traco(trace,tr,x,msg,
+                          {'iteracoes': i+1, 'avaliacoes': f.avaliacoes,
+                           'avaliacoes_df': df.avaliacoes} if info else None)
       
-def ponto_fixo(x0,f,g,tol,N,vis):
+def newton_vet(f,df,x0,tol,N,var='x',args=()):
+    """
+    Metodo de Newton vetorizado: itera simultaneamente varias
+    estimativas iniciais (e parametros por faixa), retirando as
+    faixas que convergiram ou falharam.
+
+    entrada:
+        f - string dependendo de var ou funcao f(x,*args) vetorizada
+       df - derivada (idem); None usa o passo complexo
+            Im f(x + ih)/h, que exige f analitica
+       x0 - estimativas iniciais        (array ou float)
+      tol - tolerancia do passo relativo |dx|/|x| (float)
+        N - numero maximo de iteracoes  (int)
+      var - variavel(is) das strings    (str; e.g. 'c' ou 'c,t,v,m')
+     args - parametros por faixa        (tupla de arrays ou floats)
+
+    saida:
+
+        x - raizes aproximadas          (array)
+       it - iteracoes por faixa         (array de int)
+   codigo - situacao por faixa          (array de int):
+            0 convergiu, 1 excedeu N, 2 derivada nula,
+            3 valor nao finito
+    """
+
+    if isinstance(f,str):
+        f = compila_expr(f,var)
+    if isinstance(df,str):
+        df = compila_expr(df,var)
+    elif df is None:
+        df = lambda x,*p: f(x + 1e-20j,*p).imag/1e-20
+
+    arrs = np.broadcast_arrays(np.asarray(x0,dtype=float),
+                               *[np.asarray(p) for p in args])
+    shape = arrs[0].shape
+    x = arrs[0].ravel().copy()
+    args = [p.ravel() for p in arrs[1:]]
+
+    n = x.size
+    it = np.zeros(n,dtype=int)
+    codigo = np.ones(n,dtype=int)
+
+    idx = np.arange(n)
+    xa = x
+
+    i = 0 # contador
+    while idx.size > 0 and i < N:
+        i += 1
+
+        fx = f(xa,*args)
+        dfx = df(xa,*args)
+
+        # passo de Newton apenas onde a derivada não se anula
+        nula = dfx == 0
+        if nula.any():
+            dfx = np.where(nula,1,dfx)
+        xn = xa - fx/dfx
+
+        # critério: passo relativo abaixo da tolerância (ou raiz exata);
+        # |f(x)| absoluto não entra, pois depende da escala de f
+        ok = ((np.abs(xn-xa) < tol*np.abs(xn)) | (fx == 0)) & ~nula
+        inval = ~np.isfinite(xn) & ~nula
+        fim = ok | nula | inval
+
+        # classifica e retira faixas encerradas (só compacta se houver)
+        if fim.any():
+            j = idx[fim]
+            x[j] = np.where(nula,xa,xn)[fim]
+            it[j] = i
+            codigo[idx[ok]] = 0
+            codigo[idx[nula]] = 2
+            codigo[idx[inval]] = 3
+            ativo = ~fim
+            idx, xn = idx[ativo], xn[ativo]
+            args = [p[ativo] for p in args]
+
+        xa = xn
+
+    # faixas que excederam N iterações (código 1)
+    x[idx] = xa
+    it[idx] = i
+
+    return x.reshape(shape), it.reshape(shape), codigo.reshape(shape)
+
+
+def ponto_fixo(x0,f,g,tol,N,vis,trace='tabela',info=False):
     """ 
     Resolve problema de determinacao de raizes pelo 
     metodo do ponto fixo (iteracao linear).
@@ -219,6 +591,11 @@ def ponto_fixo(x0,f,g,tol,N,vis):
        tol - tolerancia                 (float)
         N  - numero maximo de iteracoes (int)
       vis  - flag para plotagem         (bool)
+     trace - modo de registro das iteracoes:
+             None/'off' (desligado), 'tabela' (imprime ao final),
+             'registro' (retorna tambem o array de Traco) ou
+             funcao gancho(i,x,fx,erro)
+      info - se True, retorna tambem dict com iteracoes e avaliacoes
       
     saida:  
     
@@ -226,8 +603,8 @@ def ponto_fixo(x0,f,g,tol,N,vis):
     """
  
     # funcoes
-    f = eval('lambda x:' + f)
-    g = eval('lambda x:' + g)
+    f = FuncaoMemo(compila_expr(f))
+    g = FuncaoMemo(compila_expr(g))
     
     # inicializacao
     it = 0 # contador 
@@ -235,9 +612,10 @@ def ponto_fixo(x0,f,g,tol,N,vis):
     
     e = abs(x-xn)/abs(x) # erro    
 
-    # tabela
-    print('i\t x\t\t f(x)\t\t ER')
-    print('{0:d}\t {1:f}\t {2:f}\t {3:e}'.format(it,x,f(x),e))       
+    # registro das iterações
+    tr = _inicia_traco(trace,N)
+    if tr is not None:
+        tr(it,x,f(x),e)
     
     # laco
     while e >= tol and it <= N:
@@ -245,25 +623,26 @@ def ponto_fixo(x0,f,g,tol,N,vis):
         xn = x                             
         x = g(xn)               
         e = abs(x-xn)/abs(x)         
-        print('{0:d}\t {1:f}\t {2:f}\t {3:e}'.format(it,x,f(x),e))      
+        if tr is not None:
+            tr(it,x,f(x),e)
         
         if it > N:
-            print('Solução nao alcancada com N iteracoes.')
             break
+
+    if e < tol:
+        msg = 'Solução obtida: x = {0:.10f}'
+    else:
+        msg = 'Solução nao alcancada com N iteracoes.'
        
     if vis == True:
-        dx = 2*x
-        dom = linspace(x - dx,x + dx,30)
-        plot(dom,f(dom),label='$f(x)$')
-        plot(dom,dom*0,label='$y=0$')
-        plot(dom,g(dom),label='$g(x)$')
-        plot(dom,dom,label='$y=x$')
-        legend()
+        _visualiza(x,f,g)
         
-    return x
+    return _encerra_traco(trace,tr,x,msg,
+                          {'iteracoes': it, 'avaliacoes': f.avaliacoes,
+                           'avaliacoes_g': g.avaliacoes} if info else None)
         
     
-def secante(xa,xb,f,tol,N,vis):
+def secante(xa,xb,f,tol,N,vis,trace='tabela',info=False):
     """ 
     Resolve problema de determinacao de raizes pelo 
     metodo das secantes.
@@ -277,19 +656,23 @@ def secante(xa,xb,f,tol,N,vis):
        tol - tolerancia                 (float)       
         N  - numero maximo de iteracoes (int)
       vis  - flag para plotagem         (bool)
+     trace - modo de registro das iteracoes:
+             None/'off' (desligado), 'tabela' (imprime ao final),
+             'registro' (retorna tambem o array de Traco) ou
+             funcao gancho(i,x,fx,erro)
+      info - se True, retorna tambem dict com iteracoes e avaliacoes
       
     saida:  
     
        x   - raiz aproximada para f     (float)      
     """
         
-    f = eval('lambda x:' + f)
+    f = FuncaoMemo(compila_expr(f))
 
-    # imprime estimativas iniciais
-    print('Estimativas iniciais: xa = {0}; xb = {1} \n'.format(xa,xb))  
+    # registro das iterações
+    tr = _inicia_traco(trace,N)
 
-    # tabela
-    print('i\t x\t\t f(x)\t\t ER')        
+    conv = False
    
     # Loop         
     for i in range(0,N):
@@ -298,27 +681,532 @@ def secante(xa,xb,f,tol,N,vis):
                         
         e = abs(x-xb)/abs(x) # erro
                 
-        # tabela
-        print('{0:d}\t {1:f}\t {2:f}\t {3:e}'.format(i+1,x,f(x),e)) 
+        if tr is not None:
+            tr(i+1,x,f(x),e)
         
         if e < tol:
+            conv = True
             break
         xa = xb
         xb = x
         
-    if i == N:
-        print('Solução não obtida em {0:d} iterações'.format(N))
+    if conv:
+        msg = 'Solução obtida: x = {0:.10f}'
     else:
-        print('Solução obtida: x = {0:.10f}'.format(x))
+        msg = 'Solução não obtida em {0:d} iterações'.format(N)
 
     # plotagem
     if vis == True:        
-        dx = 2*x
-        dom = linspace(x - dx,x + dx,30)        
-        plot(dom,f(dom),label='$f(x)$')
-        plot(x,f(x),'ro')
+        _visualiza(x,f)
+
+    return _encerra_traco(trace,tr,x,msg,
+                          {'iteracoes': i+1, 'avaliacoes': f.avaliacoes} if info else None)
+
+
+def _bracket(f,a,b,var):
+    """
+    Compila f (se string), envolve-a em FuncaoMemo e verifica a
+    troca de sinal em [a,b].
+    """
+
+    if isinstance(f,str):
+        f = compila_expr(f,var)
+    f = FuncaoMemo(f)
+    fa, fb = f(a), f(b)
+    if fa*fb > 0:
+        raise ValueError('A função deve ter sinais opostos em a e b!')
+    return f, fa, fb
+
+
+def brent(f,a,b,tol,N,var='x',trace='tabela',info=False):
+    """
+    Metodo hibrido de Brent (Dekker): interpolacao quadratica inversa
+    ou secante quando seguras, bissecao caso contrario. Mantem sempre
+    um intervalo com troca de sinal, convergindo com poucas avaliacoes.
+
+    entrada:
+        f - string dependendo de var ou funcao f(x)
+        a - limite inferior do dominio
+        b - limite superior do dominio
+      tol - tolerancia (sobre o intervalo)
+        N - numero maximo de iteracoes
+      var - variavel da funcao (str)
+    trace - modo de registro das iteracoes (ver bissecao)
+     info - se True, retorna tambem dict com iteracoes e avaliacoes
+
+    saida:
+
+        x - raiz da funcao
+    """
+
+    f, fa, fb = _bracket(f,a,b,var)
+    tr = _inicia_traco(trace,N)
+    eps = np.finfo(float).eps
+
+    c, fc = a, fa
+    d = e = b - a
+    conv = False
+
+    for i in range(1,N+1):
+        if fb*fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2*eps*abs(b) + 0.5*tol
+        xm = 0.5*(c - b)
+        if tr is not None:
+            tr(i,b,fb,abs(c-b))
+        if abs(xm) <= tol1 or fb == 0:
+            conv = True
+            break
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb/fa
+            if a == c:
+                # secante
+                p, q = 2*xm*s, 1 - s
+            else:
+                # interpolação quadrática inversa
+                q, r = fa/fc, fb/fc
+                p = s*(2*xm*q*(q - r) - (b - a)*(r - 1))
+                q = (q - 1)*(r - 1)*(s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2*p < min(3*xm*q - abs(tol1*q),abs(e*q)):
+                e, d = d, p/q
+            else:
+                d = e = xm      # interpolação rejeitada: bisseção
+        else:
+            d = e = xm
+
+        a, fa = b, fb
+        b += d if abs(d) > tol1 else np.copysign(tol1,xm)
+        fb = f(b)
+
+    if conv:
+        msg = 'Solução encontrada: {0}'
+    else:
+        msg = 'Solução não obtida em {0:d} iterações'.format(N)
+    return _encerra_traco(trace,tr,b,msg,
+                          {'iteracoes': i, 'avaliacoes': f.avaliacoes} if info else None)
+
+
+def illinois(f,a,b,tol,N,var='x',trace='tabela',info=False):
+    """
+    Metodo da falsa posicao modificado (Illinois): quando a mesma
+    extremidade e mantida duas vezes seguidas, seu valor de f e
+    dividido por 2, evitando a convergencia unilateral lenta.
+
+    entrada:
+        f - string dependendo de var ou funcao f(x)
+        a - limite inferior do dominio
+        b - limite superior do dominio
+      tol - tolerancia (sobre |x_k - x_k-1| ou |f(x_k)|)
+        N - numero maximo de iteracoes
+      var - variavel da funcao (str)
+    trace - modo de registro das iteracoes (ver bissecao)
+     info - se True, retorna tambem dict com iteracoes e avaliacoes
+
+    saida:
+
+        x - raiz da funcao
+    """
+
+    f, fa, fb = _bracket(f,a,b,var)
+    tr = _inicia_traco(trace,N)
+
+    lado = 0
+    x = a
+    conv = False
+
+    for i in range(1,N+1):
+        xp = x
+        x = (a*fb - b*fa)/(fb - fa)
+        fx = f(x)
+        if tr is not None:
+            tr(i,x,fx,abs(b-a))
+
+        if abs(x - xp) < tol or abs(fx) < tol:
+            conv = True
+            break
+
+        if fx*fb > 0:           # raiz entre a e x
+            b, fb = x, fx
+            if lado == -1:
+                fa /= 2
+            lado = -1
+        elif fa*fx > 0:         # raiz entre x e b
+            a, fa = x, fx
+            if lado == +1:
+                fb /= 2
+            lado = +1
+        else:                   # f(x) = 0
+            conv = True
+            break
+
+    if conv:
+        msg = 'Solução encontrada: {0}'
+    else:
+        msg = 'Solução não obtida em {0:d} iterações'.format(N)
+    return _encerra_traco(trace,tr,x,msg,
+                          {'iteracoes': i, 'avaliacoes': f.avaliacoes} if info else None)
+
+
+def _raizes_bloco(intervalo,f,a,b,n,tol,N,var):
+    """
+    Raizes das amostras i0..i1 (inclusive) da malha de n pontos em [a,b]:
+    trocas de sinal detectadas vetorialmente e refinadas por bissecao_vet.
+    """
+
+    i0, i1 = intervalo
+    if isinstance(f,str):
+        f = compila_expr(f,var)
+
+    x = a + (b - a)*np.arange(i0,i1+1)/(n - 1)
+    y = f(x)
+
+    # amostras em que f se anula (a última só no último bloco)
+    fim = i1 - i0 + (i1 == n - 1)
+    zeros = x[:fim][y[:fim] == 0]
+
+    # trocas de sinal estritas entre amostras vizinhas
+    sy = np.sign(y)
+    k = np.flatnonzero(np.abs(np.diff(sy)) == 2)
+    xr, it, conv = bissecao_vet(f,x[k],x[k+1],tol,N)
+
+    # toda faixa tem troca de sinal: mesmo sem convergir em N iterações,
+    # o ponto médio do último intervalo é uma raiz (com erro <= |b-a|/2)
+    return np.concatenate((zeros,xr[~np.isnan(xr)]))
+
+
+def todas_raizes(f,a,b,n,tol=1e-12,N=100,var='x',bloco=10**6,processos=None):
+    """
+    Busca todas as raizes de f em [a,b] (forca bruta vetorizada):
+    amostra n pontos, detecta as trocas de sinal com np.diff(np.sign(y))
+    e refina todos os intervalos simultaneamente com bissecao_vet.
+
+    O dominio e varrido em blocos de ate 'bloco' amostras, de modo que
+    a memoria nao cresce com n; com processos > 1, os blocos sao
+    distribuidos entre processos (f deve ser string ou funcao de modulo).
+
+    entrada:
+        f - string dependendo de var ou funcao f(x) vetorizada
+        a - limite inferior do dominio
+        b - limite superior do dominio
+        n - numero de amostras
+      tol - tolerancia do refinamento, relativa a max(1,|x|)
+        N - numero maximo de iteracoes do refinamento; trocas de sinal
+            nao refinadas ate tol em N iteracoes ainda sao retornadas
+            (ponto medio do ultimo intervalo)
+      var - variavel da funcao (str)
+    bloco - amostras por bloco (int)
+processos - numero de processos (None ou 1: processo atual)
+
+    saida:
+
+   raizes - raizes encontradas, em ordem crescente (array)
+    """
+
+    inicios = range(0,n-1,bloco)
+    intervalos = [(i0,min(i0 + bloco,n - 1)) for i0 in inicios]
+    tarefa = partial(_raizes_bloco,f=f,a=a,b=b,n=n,tol=tol,N=N,var=var)
+
+    if processos is None or processos == 1:
+        partes = list(map(tarefa,intervalos))
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as ex:
+            partes = list(ex.map(tarefa,intervalos))
+
+    raizes = np.concatenate(partes) if partes else np.empty(0)
+    return np.sort(raizes)
+
+
+def muller_vet(f,x0,dx,tol,N,var='x',args=()):
+    """
+    Metodo de Muller vetorizado, em aritmetica complexa: a partir de
+    x0 - dx, x0 e x0 + dx, cada faixa segue a parabola interpoladora
+    ate a raiz (real ou complexa), com uma avaliacao de f por iteracao.
+
+    entrada:
+        f - string dependendo de var ou funcao f(x,*args) vetorizada,
+            valida para x complexo
+       x0 - estimativas iniciais        (array ou escalar)
+       dx - incremento para os pontos vizinhos (array ou escalar)
+      tol - tolerancia sobre o passo |h|
+        N - numero maximo de iteracoes  (int)
+      var - variavel(is) da string f    (str)
+     args - parametros por faixa: escalares ou arrays cujo primeiro
+            eixo corresponde as faixas
+
+    saida:
+
+        x - raizes aproximadas          (array complexo)
+       it - iteracoes por faixa         (array de int)
+   codigo - situacao por faixa          (array de int):
+            0 convergiu, 1 excedeu N, 3 valor nao finito
+    """
+
+    if isinstance(f,str):
+        f = compila_expr(f,var)
+
+    # estimativas e incrementos seguem a forma das faixas dos parâmetros
+    args = [np.asarray(p) for p in args]
+    lanes = [p.ndim > 0 for p in args]
+    faixas = [p.shape[:1] for p, l in zip(args,lanes) if l]
+    shape = np.broadcast_shapes(np.shape(x0),np.shape(dx),*faixas)
+    x0 = np.broadcast_to(np.asarray(x0,dtype=complex),shape)
+    dx = np.broadcast_to(np.asarray(dx,dtype=complex),shape)
+    p1 = x0.ravel().copy()
+    n = p1.size
+    p0, p2 = p1 - dx.ravel(), p1 + dx.ravel()
+    f0, f1, f2 = f(p0,*args), f(p1,*args), f(p2,*args)
+
+    x = p2.copy()
+    it = np.zeros(n,dtype=int)
+    codigo = np.ones(n,dtype=int)
+    idx = np.arange(n)
+
+    i = 0 # contador
+    while idx.size > 0 and i < N:
+        i += 1
+
+        # parábola pelos três últimos pontos
+        h0, h1 = p1 - p0, p2 - p1
+        d0, d1 = (f1 - f0)/h0, (f2 - f1)/h1
+        d = (d1 - d0)/(h1 + h0)
+        b = d1 + h1*d
+        D = np.sqrt(b**2 - 4*f2*d)
+
+        # denominador de maior módulo (critério de sgn(b))
+        E = np.where(np.abs(b - D) < np.abs(b + D),b + D,b - D)
+        h = -2*f2/np.where(E == 0,1,E)
+        xn = p2 + h
+        fn = f(xn,*args)
+
+        ok = (np.abs(h) < tol) | (fn == 0)
+        inval = ~np.isfinite(xn) | ~np.isfinite(fn)
+        fim = ok | inval
+
+        p0, p1, p2 = p1, p2, xn
+        f0, f1, f2 = f1, f2, fn
+
+        if fim.any():
+            j = idx[fim]
+            x[j] = xn[fim]
+            it[j] = i
+            codigo[idx[ok]] = 0
+            codigo[idx[inval]] = 3
+            ativo = ~fim
+            idx = idx[ativo]
+            p0, p1, p2 = p0[ativo], p1[ativo], p2[ativo]
+            f0, f1, f2 = f0[ativo], f1[ativo], f2[ativo]
+            args = [p[ativo] if l else p for p, l in zip(args,lanes)]
+
+    # faixas que excederam N iterações (código 1)
+    x[idx] = p2
+    it[idx] = i
+
+    return x.reshape(shape), it.reshape(shape), codigo.reshape(shape)
+
+
+def _horner(x,C):
+    """
+    Avalia, por Horner, o polinomio de coeficientes C[k,:] (grau
+    decrescente) no ponto x[k], para todas as faixas k.
+    """
+
+    y = C[:,0]*np.ones_like(x)
+    for j in range(1,C.shape[1]):
+        y = y*x + C[:,j]
+    return y
+
+
+def raizes_polinomio(P,tol=1e-12,N=100):
+    """
+    Todas as raizes de varios polinomios simultaneamente: Muller
+    vetorizado (uma faixa por polinomio) seguido de deflacao por
+    divisao sintetica, grau a grau, e refinamento final por Newton
+    sobre os polinomios originais.
+
+    entrada:
+        P - coeficientes (m x n+1), grau decrescente como em np.polyval,
+            com P[:,0] != 0; um vetor (n+1,) e tratado como m = 1
+      tol - tolerancia do metodo de Muller
+        N - numero maximo de iteracoes por raiz
+
+    saida:
+
+        R - raizes (m x n), complexas
+   codigo - situacao de cada raiz no metodo de Muller (ver muller_vet)
+    """
+
+    P = np.atleast_2d(np.asarray(P,dtype=complex))
+    m, n = P.shape[0], P.shape[1] - 1
+
+    R = np.zeros((m,n),dtype=complex)
+    codigo = np.zeros((m,n),dtype=int)
+    C = P.copy()
+
+    for k in range(n):
+        r, it, cod = muller_vet(_horner,np.zeros(m),0.5,tol,N,args=(C,))
+
+        # faixas que falharam recomeçam de outras estimativas iniciais
+        for x0 in (1j,-1+0.5j,2-1j):
+            j = np.flatnonzero(cod != 0)
+            if j.size == 0:
+                break
+            r2, it2, cod2 = muller_vet(_horner,np.full(j.size,x0),0.5,tol,N,
+                                       args=(C[j],))
+            melhor = cod2 == 0
+            r[j[melhor]], cod[j[melhor]] = r2[melhor], 0
+
+        R[:,k], codigo[:,k] = r, cod
+
+        # deflação: C(x) = (x - r) Q(x)
+        Q = C[:,:-1].copy()
+        for j in range(1,Q.shape[1]):
+            Q[:,j] += r*Q[:,j-1]
+        C = Q
+
+    # refinamento por Newton sobre o polinômio original
+    for _ in range(2):
+        p = P[:,:1]*np.ones_like(R)
+        dp = np.zeros_like(R)
+        for j in range(1,n+1):
+            dp = dp*R + p
+            p = p*R + P[:,j:j+1]
+        R -= np.where(dp != 0,p/np.where(dp != 0,dp,1),0)
+
+    return R, codigo
+
+
+def ponto_fixo_vet(g,x0,tol,N,metodo='steffensen',m=5,var='x',args=(),info=False):
+    """
+    Iteracao de ponto fixo x = g(x) vetorizada, sobre um lote de
+    estimativas iniciais, com aceleracao opcional:
+
+        'simples'    - x <- g(x)                          (1 avaliacao)
+        'steffensen' - Aitken delta^2 sobre x, g(x), g(g(x)),
+                       componente a componente; indicado
+                       para g escalar                     (2 avaliacoes)
+        'anderson'   - mistura de Anderson com as m ultimas
+                       diferencas de g(x) - x             (1 avaliacao)
+
+    entrada:
+        g - string dependendo de var ou funcao g(x,*args) vetorizada; para
+            g vetorial, g(X) recebe e retorna arrays (k x d)
+       x0 - estimativas iniciais: escalar ou (k,) para g escalar;
+            (k x d) para g vetorial (uma estimativa por linha)
+      tol - tolerancia sobre o erro relativo entre iteradas
+        N - numero maximo de iteracoes  (int)
+   metodo - 'simples', 'steffensen' ou 'anderson'
+        m - profundidade da mistura de Anderson (int)
+      var - variavel(is) da string g    (str)
+     args - parametros por faixa: escalares ou arrays cujo primeiro
+            eixo corresponde as faixas
+     info - se True, retorna tambem dict com as avaliacoes de g
+
+    saida:
+
+        x - pontos fixos aproximados    (array, forma de x0)
+       it - iteracoes por faixa         (array de int)
+   codigo - situacao por faixa          (array de int):
+            0 convergiu, 1 excedeu N, 3 valor nao finito
+     info - dict com avaliacoes (por faixa) e total
+    """
+
+    if metodo not in ('simples','steffensen','anderson'):
+        raise ValueError("metodo deve ser 'simples', 'steffensen' ou 'anderson'.")
+    if isinstance(g,str):
+        g = compila_expr(g,var)
+
+    args = [np.asarray(p) for p in args]
+    lanes = [p.ndim > 0 for p in args]
+    faixas = [p.shape[:1] for p, l in zip(args,lanes) if l]
+
+    # estimativas seguem a forma das faixas dos parâmetros
+    x0 = np.asarray(x0,dtype=float)
+    escalar = x0.ndim < 2
+    if escalar:
+        x0 = np.broadcast_to(x0,np.broadcast_shapes(x0.shape,*faixas))
+    else:
+        x0 = np.broadcast_to(x0,np.broadcast_shapes(x0.shape[:1],*faixas)
+                             + x0.shape[1:])
+    shape = x0.shape
+    X = x0.reshape(-1,1).copy() if escalar else x0.copy()
+    n = X.shape[0]
+
+    def G(Xa,args):
+        if escalar:
+            return np.broadcast_to(g(Xa[:,0],*args),Xa.shape[:1])[:,None]
+        return np.asarray(g(Xa,*args),dtype=float)
+
+    it = np.zeros(n,dtype=int)
+    codigo = np.ones(n,dtype=int)
+    idx = np.arange(n)
+    Xa = X.copy()
+
+    # histórico de Anderson: diferenças de F = g(x) - x e de g(x)
+    dF = dG = np.zeros((n,X.shape[1],0))
+    Fp = Gp = None
+
+    i = 0 # contador
+    while idx.size > 0 and i < N:
+        i += 1
+
+        if metodo == 'simples':
+            Xn = G(Xa,args)
+        elif metodo == 'steffensen':
+            X1 = G(Xa,args)
+            X2 = G(X1,args)
+            d1, den = X1 - Xa, X2 - 2*X1 + Xa
+            nulo = den == 0
+            Xn = np.where(nulo,X2,Xa - d1**2/np.where(nulo,1,den))
+        else:
+            Ga = G(Xa,args)
+            Fa = Ga - Xa
+            if Fp is not None:
+                dF = np.concatenate((dF,(Fa - Fp)[:,:,None]),axis=2)[:,:,-m:]
+                dG = np.concatenate((dG,(Ga - Gp)[:,:,None]),axis=2)[:,:,-m:]
+            Fp, Gp = Fa, Ga
+            Xn = Ga
+            if dF.shape[2] > 0:
+                gama = np.linalg.pinv(dF) @ Fa[:,:,None]
+                Xn = Ga - (dG @ gama)[:,:,0]
+
+        ok = (np.abs(Xn - Xa).max(axis=1) <= tol*np.abs(Xn).max(axis=1))
+        inval = ~np.isfinite(Xn).all(axis=1)
+        fim = ok | inval
+
+        if fim.any():
+            j = idx[fim]
+            X[j] = Xn[fim]
+            it[j] = i
+            codigo[idx[ok]] = 0
+            codigo[idx[inval]] = 3
+            ativo = ~fim
+            idx, Xn = idx[ativo], Xn[ativo]
+            args = [p[ativo] if l else p for p, l in zip(args,lanes)]
+            if metodo == 'anderson':
+                dF, dG, Fp, Gp = dF[ativo], dG[ativo], Fp[ativo], Gp[ativo]
+
+        Xa = Xn
+
+    # faixas que excederam N iterações (código 1)
+    X[idx] = Xa
+    it[idx] = i
+
+    x = X.reshape(shape)
+    it, codigo = it.reshape(shape[:1]), codigo.reshape(shape[:1])
+    if info:
+        aval = it*(2 if metodo == 'steffensen' else 1)
+        return x, it, codigo, {'avaliacoes': aval, 'total': int(aval.sum())}
+    return x, it, codigo
 
-    return x        
 
 if __name__ == '__main__':
     None
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lotes de polinomios: avaliacao, derivacao e raizes de muitos polinomios
+de uma so vez, com os coeficientes empilhados em um array 2-D.
+"""
+
+import numpy as np
+
+__all__ = ['Polinomios']
+
+
+class Polinomios:
+    """
+    Lote de m polinomios de grau (no maximo) n, armazenados como as linhas
+    de um array C (m x n+1) de coeficientes em grau decrescente, como em
+    np.polyval e np.polyfit.
+
+    entrada:
+        C - coeficientes (m x n+1), ou (n+1,) para um unico polinomio
+
+    uso:
+        P = Polinomios.ajusta(x,Y,g)   # um ajuste por linha de Y
+        P(xx)                          # P.avalia(xx), array (m x len(xx))
+        Polinomios(p)(2.0)             # um polinomio, x escalar: escalar,
+                                       # como np.polyval(p,2.0)
+        P.deriva().avalia(xx)          # derivadas no mesmo grid
+        P.raizes()                     # raizes, array (m x n) complexo
+    """
+
+    def __init__(self,C):
+        C = np.asarray(C)
+        if not np.iscomplexobj(C):
+            C = C.astype(float)
+        self.unico = C.ndim == 1
+        self.C = np.atleast_2d(C)
+
+    @classmethod
+    def ajusta(cls,x,Y,g):
+        """
+        Ajuste polinomial discreto (minimos quadrados) de grau g para cada
+        linha de Y sobre a mesma tabela x, em uma unica fatoracao.
+
+        entrada:
+            x - abscissas (p,)
+            Y - ordenadas (m x p), uma tabela por linha
+            g - grau do polinomio de ajuste (int)
+
+        saida:
+
+            P - Polinomios com os m ajustes
+        """
+
+        Y = np.atleast_2d(Y)
+        return cls(np.polyfit(x,Y.T,g).T)
+
+    @property
+    def grau(self):
+        return self.C.shape[1] - 1
+
+    def __len__(self):
+        return self.C.shape[0]
+
+    def __getitem__(self,k):
+        return Polinomios(self.C[k])
+
+    def __repr__(self):
+        return f'Polinomios(m={len(self)}, grau={self.grau})'
+
+    def avalia(self,x):
+        """
+        Avalia todos os polinomios por Horner.
+
+        entrada:
+            x - pontos: escalar, (p,) grid comum a todos, ou (m x p), um
+                grid por polinomio
+
+        saida:
+
+            y - valores (m x p); (m,) se x for escalar. Para um unico
+                polinomio (C dado como (n+1,)), o eixo m e omitido: (p,)
+                ou escalar, como em np.polyval
+        """
+
+        x = np.asarray(x)
+        escalar = x.ndim == 0
+        if escalar:
+            x = x.reshape(1)
+        C = self.C
+        y = np.broadcast_to(C[:,:1],np.broadcast_shapes(C[:,:1].shape,x.shape))
+        for j in range(1,C.shape[1]):
+            y = y*x + C[:,j:j+1]
+        y = np.array(y)
+
+        if escalar:
+            y = y[:,0]
+        return y[0] if self.unico else y
+
+    __call__ = avalia
+
+    def deriva(self,k=1):
+        """
+        Derivada de ordem k de todos os polinomios.
+
+        saida:
+
+            D - Polinomios de grau n-k (o polinomio nulo se k > n)
+        """
+
+        n = self.grau
+        if k > n:
+            D = np.zeros((len(self),1),dtype=self.C.dtype)
+            return Polinomios(D[0] if self.unico else D)
+
+        # fator (n-j)!/(n-j-k)! da coluna j (potência n-j)
+        p = n - np.arange(n+1-k)
+        fator = np.ones(p.size)
+        for i in range(k):
+            fator *= p - i
+        D = self.C[:,:n+1-k]*fator
+        return Polinomios(D[0] if self.unico else D)
+
+    def raizes(self):
+        """
+        Raizes de todos os polinomios pelos autovalores das matrizes
+        companheiras, calculados em lote (np.linalg.eigvals sobre a pilha
+        de matrizes). Linhas com coeficientes lideres nulos tem grau menor
+        e sao agrupadas por grau; as posicoes excedentes recebem nan.
+
+        saida:
+
+            R - raizes (m x n), complexo
+        """
+
+        C = self.C
+        m, n = len(self), self.grau
+        R = np.full((m,n),np.nan,dtype=complex)
+
+        nz = C != 0
+        lider = np.where(nz.any(axis=1),nz.argmax(axis=1),n)
+        for d in np.unique(n - lider):
+            if d < 1:
+                continue
+            k = np.flatnonzero(n - lider == d)
+            a = C[k,n-d:]
+            a = a[:,1:]/a[:,:1]
+
+            # companheira: -a na primeira linha, 1 na subdiagonal
+            M = np.zeros((k.size,d,d),dtype=a.dtype)
+            M[:,0,:] = -a
+            M[:,np.arange(1,d),np.arange(d-1)] = 1
+            R[k,:d] = np.linalg.eigvals(M)
+
+        return R
+
+
+if __name__ == '__main__':
+    None
@@ -0,0 +1,32 @@
+import os, sys, time
+import numpy as np
+
+# Compara a eliminação de Gauss vetorizada (sistemasLineares) com
+# numpy.linalg.solve para n = 10 ... 4000.
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from sistemasLineares import gauss_pivparc, gauss_blocos
+
+def cronometra(fun, *args, repeticoes=3):
+    melhor = np.inf
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        fun(*args)
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor
+
+
+# Usage:
+rng = np.random.default_rng(0)
+print(f"{'n':>6} {'pivparc [s]':>12} {'blocos [s]':>12} {'linalg [s]':>12} {'erro':>10}")
+for n in [10, 100, 500, 1000, 2000, 4000]:
+    A = rng.standard_normal((n, n))
+    b = rng.standard_normal((n, 1))
+    AB = np.hstack([A, b])
+
+    # a versão coluna a coluna é limitada por memória; omitida para n grande
+    tp = cronometra(gauss_pivparc, AB) if n <= 2000 else np.nan
+    tb = cronometra(gauss_blocos, AB)
+    tl = cronometra(np.linalg.solve, A, b)
+    erro = np.abs(gauss_blocos(AB) - np.linalg.solve(A, b)).max()
+    print(f"{n:>6} {tp:>12.4f} {tb:>12.4f} {tl:>12.4f} {erro:>10.2e}")
@@ -0,0 +1,29 @@
+import subprocess, sys, os
+
+# Mede o tempo de importação de metodosRaizes em um interpretador limpo
+# e verifica que o matplotlib não é carregado (plotagem é sob demanda).
+
+raiz = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+codigo = """
+import sys, time
+t0 = time.perf_counter()
+import metodosRaizes
+dt = time.perf_counter() - t0
+print(dt, any(m.split('.')[0] == 'matplotlib' for m in sys.modules))
+"""
+
+def mede_importacao(repeticoes=10):
+    tempos = []
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, '-c', codigo], cwd=raiz,
+                               capture_output=True, text=True, check=True)
+        dt, mpl = saida.stdout.split()
+        if mpl == 'True':
+            raise RuntimeError('metodosRaizes importou matplotlib.')
+        tempos.append(float(dt))
+    return min(tempos)
+
+
+# Usage:
+print(f"Importação de metodosRaizes: {1e3*mede_importacao():.2f} ms (sem matplotlib)")
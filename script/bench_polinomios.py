@@ -0,0 +1,39 @@
+import os, sys, time
+import numpy as np
+
+# Compara o lote de polinômios (polinomios.Polinomios) com um laço em
+# Python sobre np.poly1d: avaliação em um grid comum, derivada e raízes.
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from polinomios import Polinomios
+
+def cronometra(fun, *args, repeticoes=3):
+    melhor = np.inf
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        fun(*args)
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor
+
+def laco(C, x):
+    ps = [np.poly1d(c) for c in C]
+    return (np.array([p(x) for p in ps]),
+            np.array([p.deriv()(x) for p in ps]),
+            np.array([p.roots for p in ps]))
+
+def lote(C, x):
+    P = Polinomios(C)
+    return P(x), P.deriva()(x), P.raizes()
+
+
+# Usage:
+rng = np.random.default_rng(0)
+x = np.linspace(-1, 1, 200)
+print(f"{'m':>6} {'grau':>5} {'poly1d [s]':>12} {'lote [s]':>12} {'ganho':>8} {'erro':>10}")
+for m in [100, 1000, 5000]:
+    for g in [3, 8]:
+        C = rng.standard_normal((m, g+1))
+        tl = cronometra(laco, C, x)
+        tv = cronometra(lote, C, x)
+        erro = max(np.abs(a - b).max() for a, b in zip(laco(C, x)[:2], lote(C, x)[:2]))
+        print(f"{m:>6} {g:>5} {tl:>12.4f} {tv:>12.4f} {tl/tv:>7.1f}x {erro:>10.2e}")
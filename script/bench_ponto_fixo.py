@@ -0,0 +1,35 @@
+import os, sys, time
+import numpy as np
+
+# Compara as avaliações de g da iteração de ponto fixo simples com as
+# versões aceleradas (Steffensen, Anderson) de metodosRaizes.ponto_fixo_vet.
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from metodosRaizes import ponto_fixo_vet
+
+def executa(g, x0, metodo, **opcoes):
+    t0 = time.perf_counter()
+    x, it, codigo, info = ponto_fixo_vet(g, x0, 1e-10, 20000, metodo, info=True, **opcoes)
+    return info['total'], time.perf_counter() - t0, np.mean(codigo == 0)
+
+# g vetorial: iteração de Jacobi para -u'' = exp(u) discretizado (d pontos)
+d = 20
+h = 1/(d + 1)
+def jacobi(X):
+    Y = np.pad(X, ((0, 0), (1, 1)))
+    return (Y[:, :-2] + Y[:, 2:] + h*h*np.exp(X))/2
+
+
+# Usage:
+rng = np.random.default_rng(0)
+casos = [('x = cos(x), k=1000', 'cos(x)', rng.uniform(-1, 1, 1000),
+          ['steffensen', 'anderson']),
+         ('Jacobi d=20, k=100', jacobi, rng.random((100, d)), ['anderson'])]
+
+print(f"{'problema':>20} {'metodo':>11} {'avaliacoes':>11} {'reducao':>8} {'tempo [s]':>10} {'conv.':>6}")
+for nome, g, x0, metodos in casos:
+    base, t, c = executa(g, x0, 'simples')
+    print(f"{nome:>20} {'simples':>11} {base:>11d} {1:>7.1f}x {t:>10.4f} {c:>6.0%}")
+    for metodo in metodos:
+        total, t, c = executa(g, x0, metodo, m=10)
+        print(f"{nome:>20} {metodo:>11} {total:>11d} {base/total:>7.1f}x {t:>10.4f} {c:>6.0%}")
@@ -0,0 +1,43 @@
+import os, sys, time
+import numpy as np
+from scipy.interpolate import CubicSpline, PchipInterpolator
+
+# Compara os splines de interpolacao (construção e avaliação em lotes
+# ordenados e embaralhados) com scipy.interpolate, em tabelas grandes.
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from interpolacao import SplineCubico, PCHIP
+
+def cronometra(fun, *args, repeticoes=3):
+    melhor = np.inf
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        fun(*args)
+        melhor = min(melhor, time.perf_counter() - t0)
+    return melhor
+
+
+# Usage:
+rng = np.random.default_rng(0)
+n, p = 10**6, 5*10**6
+X = np.cumsum(rng.uniform(0.5, 1.5, n))
+Y = np.log1p(X) + 0.1*np.sin(X)
+xo = np.linspace(X[0], X[-1], p)
+xe = rng.permutation(xo)
+
+print(f"{'metodo':>8} {'construcao [s]':>15} {'ordenado [s]':>13} {'embaralhado [s]':>16} {'busca reusada [s]':>18} {'erro':>10}")
+for nome, Classe, Ref in [('spline', SplineCubico, lambda X, Y: CubicSpline(X, Y, bc_type='natural')),
+                          ('pchip', PCHIP, PchipInterpolator),
+                          ('scipy-s', None, lambda X, Y: CubicSpline(X, Y, bc_type='natural')),
+                          ('scipy-p', None, PchipInterpolator)]:
+    if Classe is None:
+        tc = cronometra(Ref, X, Y)
+        s = Ref(X, Y)
+        print(f"{nome:>8} {tc:>15.4f} {cronometra(s, xo):>13.4f} {cronometra(s, xe):>16.4f} {'-':>18} {'-':>10}")
+        continue
+    tc = cronometra(Classe, X, Y)
+    s = Classe(X, Y)
+    i = s.localiza(xo)
+    erro = np.abs(s(xo, i) - Ref(X, Y)(xo)).max()
+    print(f"{nome:>8} {tc:>15.4f} {cronometra(s, xo):>13.4f} {cronometra(s, xe):>16.4f} "
+          f"{cronometra(s, xo, i):>18.4f} {erro:>10.2e}")
@@ -0,0 +1,37 @@
+import os, sys
+import numpy as np
+
+# Verifica que as rotinas aceitam as entradas dos notebooks originais
+# (listas Python em vez de arrays), comparando com numpy.linalg.solve.
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from sistemasLineares import (subst_progressiva, subst_regressiva, jacobi_csr,
+                              gauss_seidel_csr, sor_csr, gc_csr, gmres_csr)
+
+A = np.array([[4., -1, 0], [-1, 4, -1], [0, -1, 4]])
+b = [1., 2, 3]
+
+for nome, fun, M in [('subst_progressiva', subst_progressiva, np.tril(A)),
+                     ('subst_regressiva', subst_regressiva, np.triu(A))]:
+    x = fun(M, b)
+    assert np.allclose(x, np.linalg.solve(M, b)), nome
+    print(f"{nome:>18}: ok")
+
+# métodos iterativos CSR (substitutos de jacobi/gauss_seidel da aula-08)
+for fun in [jacobi_csr, gauss_seidel_csr, sor_csr, gc_csr, gmres_csr]:
+    x, k, res = fun(A, b, tol=1e-12)
+    assert np.allclose(x, np.linalg.solve(A, b)), fun.__name__
+    print(f"{fun.__name__:>18}: ok ({k} iteracoes)")
+
+# omega estimado em sistemas pequenos (n = 2, 3)
+for M in [A[:2, :2], A]:
+    x, k, res = sor_csr(M, b[:M.shape[0]], tol=1e-12)
+    assert np.allclose(x, np.linalg.solve(M, b[:M.shape[0]])), 'sor_csr'
+    print(f"{'sor_csr n=' + str(M.shape[0]):>18}: ok ({k} iteracoes)")
+
+# lado direito em coluna (n x 1), como retornado por gauss_* e FatoracaoLU
+bc = np.array(b).reshape(-1, 1)
+for fun in [jacobi_csr, gauss_seidel_csr, sor_csr, gc_csr, gmres_csr]:
+    x, k, res = fun(A, bc, tol=1e-12)
+    assert x.shape == bc.shape and np.allclose(x, np.linalg.solve(A, bc)), fun.__name__
+    print(f"{fun.__name__ + ' (n x 1)':>26}: ok")
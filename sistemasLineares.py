@@ -0,0 +1,746 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metodos para solucao de sistemas lineares Ax = b.
+"""
+
+from functools import lru_cache
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import spsolve_triangular, eigs, ArpackNoConvergence
+
+__all__ = ['gauss_simples', 'gauss_pivparc', 'gauss_blocos',
+           'subst_progressiva', 'subst_regressiva', 'FatoracaoLU', 'exibe',
+           'jacobi_csr', 'gauss_seidel_csr', 'MonitorConvergencia',
+           'estima_omega', 'sor_csr', 'gc_csr', 'gmres_csr']
+
+
+def _tipo(*arrs):
+    """
+    Tipo de ponto flutuante comum aos arrays (inteiros viram float64);
+    listas e tuplas sao convertidas antes (np.result_type as leria como
+    especificacao de dtype estruturado).
+    """
+
+    t = np.result_type(*[np.asarray(a) for a in arrs])
+    return t if np.issubdtype(t,np.inexact) else np.dtype(float)
+
+
+def exibe(X,decimais=3):
+    """
+    Imprime X arredondado (apenas na apresentacao; X nao e alterado).
+
+    entrada:
+          X - array
+   decimais - casas decimais exibidas (int)
+    """
+
+    with np.printoptions(precision=decimais,suppress=True):
+        print(np.asarray(X))
+
+
+def subst_progressiva(L,B,unitaria=False):
+    """
+    Substituicao progressiva: resolve L X = B, L triangular inferior.
+
+    entrada:
+          L - matriz triangular inferior (n x n)
+          B - lado direito (n,) ou (n x m)
+   unitaria - se True, assume diagonal unitaria (ignora L[i,i])
+
+    saida:
+
+          X - solucao, com a forma de B
+    """
+
+    X = np.array(B,dtype=_tipo(L,B))
+    n = L.shape[0]
+
+    # cada linha é resolvida com um produto interno vetorizado
+    # (sobre todas as colunas de B de uma só vez)
+    for i in range(n):
+        X[i] -= L[i,:i] @ X[:i]
+        if not unitaria:
+            X[i] /= L[i,i]
+
+    return X
+
+
+def subst_regressiva(U,B):
+    """
+    Substituicao regressiva: resolve U X = B, U triangular superior.
+
+    entrada:
+          U - matriz triangular superior (n x n)
+          B - lado direito (n,) ou (n x m)
+
+    saida:
+
+          X - solucao, com a forma de B
+    """
+
+    X = np.array(B,dtype=_tipo(U,B))
+    n = U.shape[0]
+
+    for i in range(n-1,-1,-1):
+        X[i] -= U[i,i+1:] @ X[i+1:]
+        X[i] /= U[i,i]
+
+    return X
+
+
+def _elimina(A,n,pivota=True,nb=None):
+    """
+    Eliminacao de Gauss in-place sobre as n primeiras colunas de A
+    (A pode ser a matriz aumentada [A|B]).
+
+    Ao final, o triangulo superior de A[:n,:n] contem U, o inferior
+    estrito contem os multiplicadores (L de diagonal unitaria) e as
+    colunas restantes contem L^{-1} P B.
+
+    entrada:
+          A - matriz (n x n+m), modificada in-place
+          n - numero de linhas/pivos
+     pivota - pivotamento parcial pelo max |a_ik| (bool)
+         nb - largura do bloco; None elimina coluna a coluna
+
+    saida:
+
+        piv - vetor de permutacao: linha i de PA = linha piv[i] de A
+    """
+
+    piv = np.arange(n)
+    nb = n if nb is None else nb
+
+    for k0 in range(0,n,nb):
+        k1 = min(k0 + nb,n)
+
+        # sem blocagem, a atualização de posto 1 vai até a última coluna;
+        # com blocagem, fica restrita ao painel [k0,k1)
+        fim = A.shape[1] if nb == n else k1
+
+        for k in range(k0,k1):
+
+            # pivotamento parcial: troca linhas inteiras
+            if pivota:
+                p = k + np.argmax(np.abs(A[k:,k]))
+                if p != k:
+                    A[[k,p]] = A[[p,k]]
+                    piv[[k,p]] = piv[[p,k]]
+
+            if A[k,k] == 0:
+                raise ValueError('Pivô nulo na coluna {0}: matriz singular '
+                                 'ou requer pivotamento.'.format(k))
+
+            # multiplicadores e atualização de posto 1 (vetorizada)
+            A[k+1:,k] /= A[k,k]
+            A[k+1:,k+1:fim] -= np.outer(A[k+1:,k],A[k,k+1:fim])
+
+        if fim < A.shape[1]:
+            # linhas de U (e de L^{-1}B) do bloco: L11 U12 = A12
+            A[k0:k1,k1:] = subst_progressiva(A[k0:k1,k0:k1],A[k0:k1,k1:],
+                                             unitaria=True)
+
+            # complemento de Schur: uma multiplicação matriz-matriz
+            A[k1:,k1:] -= A[k1:,k0:k1] @ A[k0:k1,k1:]
+
+    return piv
+
+
+def _resolve_aumentada(AB,pivota,nb,dtype):
+    """
+    Elimina a matriz aumentada AB e resolve por substituicao regressiva.
+    """
+
+    AB = np.array(AB,dtype=dtype)
+    n = AB.shape[0]
+
+    _elimina(AB,n,pivota,nb)
+
+    return subst_regressiva(AB[:,:n],AB[:,n:])
+
+
+def gauss_simples(AB,dtype=np.float64):
+    """
+    Eliminacao de Gauss sem pivotamento (atualizacao vetorizada
+    de posto 1 a cada pivo).
+
+    entrada:
+         AB - matriz aumentada [A|B] (n x n+m)
+      dtype - precisao de trabalho (np.float64 ou np.float32)
+
+    saida:
+
+          X - solucao (n x m), sem arredondamento (ver exibe)
+    """
+
+    return _resolve_aumentada(AB,False,None,dtype)
+
+
+def gauss_pivparc(AB,dtype=np.float64):
+    """
+    Eliminacao de Gauss com pivotamento parcial: o pivo da coluna k
+    e o elemento de maior |a_ik|, i >= k.
+
+    entrada:
+         AB - matriz aumentada [A|B] (n x n+m)
+      dtype - precisao de trabalho (np.float64 ou np.float32)
+
+    saida:
+
+          X - solucao (n x m), sem arredondamento (ver exibe)
+    """
+
+    return _resolve_aumentada(AB,True,None,dtype)
+
+
+def gauss_blocos(AB,nb=64,dtype=np.float64):
+    """
+    Eliminacao de Gauss com pivotamento parcial, em blocos: cada painel
+    de nb colunas e eliminado coluna a coluna e o restante da matriz e
+    atualizado por uma multiplicacao matriz-matriz (adequado para n grande).
+
+    entrada:
+         AB - matriz aumentada [A|B] (n x n+m)
+         nb - largura do bloco (int)
+      dtype - precisao de trabalho (np.float64 ou np.float32)
+
+    saida:
+
+          X - solucao (n x m), sem arredondamento (ver exibe)
+    """
+
+    return _resolve_aumentada(AB,True,nb,dtype)
+
+
+class FatoracaoLU:
+    """
+    Fatoracao PA = LU calculada uma unica vez e reutilizada para
+    quantos lados direitos forem necessarios (O(n^2) por coluna).
+
+    entrada:
+          A - matriz (n x n)
+     pivota - pivotamento parcial (bool); False reproduz lu_nopivot
+         nb - largura do bloco da eliminacao (int ou None)
+      dtype - precisao de trabalho (np.float64 ou np.float32); em
+              float32 a memoria e o trafego caem pela metade
+
+    L e U ficam compactados em um unico array (LU), com a diagonal
+    unitaria de L implicita, e a permutacao no vetor piv.
+    """
+
+    def __init__(self,A,pivota=True,nb=64,dtype=np.float64):
+        self.LU = np.array(A,dtype=dtype)
+        n, m = self.LU.shape
+        if n != m:
+            raise ValueError('A matriz deve ser quadrada.')
+        self.piv = _elimina(self.LU,n,pivota,nb)
+
+    @property
+    def L(self):
+        n = self.LU.shape[0]
+        return np.tril(self.LU,-1) + np.eye(n,dtype=self.LU.dtype)
+
+    @property
+    def U(self):
+        return np.triu(self.LU)
+
+    def resolve(self,B):
+        """
+        Resolve A X = B para uma ou varias colunas de B.
+
+        entrada:
+              B - lado direito (n,) ou (n x m)
+
+        saida:
+
+              X - solucao, com a forma de B
+        """
+
+        B = np.asarray(B,dtype=self.LU.dtype)
+        Y = subst_progressiva(self.LU,B[self.piv],unitaria=True)
+        return subst_regressiva(self.LU,Y)
+
+
+def _prepara_csr(A,b,x0):
+    """
+    Converte A para CSR e valida a diagonal; retorna A, diagonal, b, x
+    e a forma original de b. Um b coluna (n x 1), como nos metodos
+    gauss_* e em FatoracaoLU, e tratado como vetor (n,).
+    """
+
+    A = sp.csr_array(A)
+    A.sort_indices()
+    b = np.asarray(b)
+    forma = b.shape
+    if b.ndim == 2 and b.shape[1] == 1:
+        b = b.ravel()
+    elif b.ndim != 1:
+        raise ValueError('b deve ser um vetor (n,) ou uma coluna (n x 1).')
+    b = b.astype(_tipo(A.data,b),copy=False)
+    d = A.diagonal()
+    if np.any(d == 0):
+        raise ValueError('A diagonal de A não pode ter elementos nulos.')
+    x = np.zeros_like(b) if x0 is None else np.array(x0,dtype=b.dtype).ravel()
+    if x.size != b.size:
+        raise ValueError('x0 deve ter o tamanho de b.')
+    return A, d, b, x, forma
+
+
+@lru_cache(maxsize=1)
+def _nucleos():
+    """
+    Nucleos CSR compilados com numba (varredura SOR/Gauss-Seidel e
+    residuo sem alocacao), se disponivel; senao, None.
+    """
+
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def varredura(indptr,indices,data,b,x,omega):
+        for i in range(b.size):
+            s = b[i]
+            dii = 1.0
+            for k in range(indptr[i],indptr[i+1]):
+                j = indices[k]
+                if j == i:
+                    dii = data[k]
+                else:
+                    s -= data[k]*x[j]
+            x[i] += omega*(s/dii - x[i])
+
+    @njit(cache=True)
+    def residuo(indptr,indices,data,b,x,r):
+        s2 = 0.0
+        for i in range(b.size):
+            s = b[i]
+            for k in range(indptr[i],indptr[i+1]):
+                s -= data[k]*x[indices[k]]
+            r[i] = s
+            s2 += s*s
+        return np.sqrt(s2)
+
+    return varredura, residuo
+
+
+def _residuo(A,b,x,r):
+    """
+    Calcula r = b - Ax no buffer r e retorna ||r||.
+    """
+
+    nucleos = _nucleos()
+    if nucleos is not None:
+        return nucleos[1](A.indptr,A.indices,A.data,b,x,r)
+    np.subtract(b,A @ x,out=r)
+    return np.linalg.norm(r)
+
+
+class _Historico:
+    """
+    Historico opcional das iteracoes: 'residuo' guarda apenas as normas
+    dos residuos (array pre-alocado); um inteiro k guarda cada k-esima
+    iterada.
+    """
+
+    def __init__(self,modo,nit):
+        if modo == 'residuo':
+            self.dados = np.empty(nit+1)
+        elif isinstance(modo,int) and modo > 0:
+            self.dados = []
+        else:
+            raise ValueError("historico deve ser None, 'residuo' ou inteiro positivo.")
+        self.modo = modo
+        self.n = 0
+
+    def __call__(self,k,x,res):
+        if self.modo == 'residuo':
+            self.dados[k] = res
+        elif k % self.modo == 0 and x is not None:
+            self.dados.append(x.copy())
+        self.n = k + 1
+
+    def resultado(self):
+        if self.modo == 'residuo':
+            return self.dados[:self.n]
+        return np.array(self.dados)
+
+
+class MonitorConvergencia:
+    """
+    Criterio de parada e historico comuns aos metodos iterativos.
+
+    entrada:
+          b - lado direito (para o residuo relativo)
+        tol - tolerancia do residuo relativo ||r||/||b||
+        nit - numero maximo de iteracoes
+  historico - None, 'residuo' (normas dos residuos) ou k (cada
+              k-esima iterada)
+      forma - forma de x na saida (e.g., coluna n x 1), ou None
+
+    O metodo chama monitor(k,x,||r||) a cada iteracao; o retorno e True
+    quando deve parar. Os atributos k, res e convergiu descrevem o estado.
+    """
+
+    def __init__(self,b,tol,nit,historico=None,forma=None):
+        self.nb = np.linalg.norm(b) or 1.0
+        self.forma = forma
+        self.tol = tol
+        self.nit = nit
+        self.hist = None if historico is None else _Historico(historico,nit)
+        self.k = 0
+        self.res = np.inf
+
+    def __call__(self,k,x,rnorm):
+        self.k = k
+        self.res = rnorm/self.nb
+        if self.hist is not None:
+            self.hist(k,x,self.res)
+        return self.convergiu or k >= self.nit
+
+    @property
+    def convergiu(self):
+        return self.res < self.tol
+
+    def resultado(self,x):
+        """
+        Tupla de retorno dos metodos: (x, k, res[, hist]).
+        """
+
+        if self.forma is not None:
+            x = x.reshape(self.forma)
+
+        if self.hist is not None:
+            return x, self.k, self.res, self.hist.resultado()
+        return x, self.k, self.res
+
+
+def _itera(varre,A,b,x,tol,nit,historico,forma=None):
+    """
+    Laco comum as iteracoes estacionarias: aplica varre(x, r) in-place
+    ate ||b - Ax||/||b|| < tol, sem alocar vetores a cada passo.
+    """
+
+    r = np.empty_like(b)
+    monitor = MonitorConvergencia(b,tol,nit,historico,forma)
+
+    k = 0
+    while not monitor(k,x,_residuo(A,b,x,r)):
+        varre(x,r)
+        k += 1
+
+    return monitor.resultado(x)
+
+
+def jacobi_csr(A,b,x0=None,tol=1e-8,nit=1000,historico=None):
+    """
+    Metodo de Jacobi para Ax = b com A esparsa (CSR), sem formar a
+    matriz de iteracao C: cada varredura e x <- x + D^{-1}(b - Ax),
+    usando o residuo ja calculado para o teste de parada.
+
+    entrada:
+          A - matriz n x n (densa ou scipy.sparse)
+          b - vetor n (ou coluna n x 1)
+         x0 - ponto de partida (vetor n; None = zeros)
+        tol - tolerancia do residuo relativo ||b - Ax||/||b||
+        nit - numero maximo de iteracoes
+  historico - None (apenas o vetor corrente e mantido), 'residuo'
+              (normas dos residuos) ou k (cada k-esima iterada)
+
+    saida:
+
+          x - vetor solucao, com a forma de b
+          k - iteracoes realizadas
+        res - residuo relativo final
+       hist - historico (apenas se historico nao for None)
+    """
+
+    A, d, b, x, forma = _prepara_csr(A,b,x0)
+    aux = np.empty_like(b)
+
+    def varre(x,r):
+        np.divide(r,d,out=aux)
+        x += aux
+
+    return _itera(varre,A,b,x,tol,nit,historico,forma)
+
+
+def _varredura_sor(A,b,omega):
+    """
+    Retorna varre(x,r), uma varredura SOR in-place (omega = 1 e
+    Gauss-Seidel): compilada (numba) ou x <- x + (D/omega + L)^{-1} r.
+    """
+
+    nucleos = _nucleos()
+
+    if nucleos is not None:
+        def varre(x,r):
+            nucleos[0](A.indptr,A.indices,A.data,b,x,omega)
+    else:
+        M = sp.tril(A,-1,format='csr') + sp.diags_array(A.diagonal()/omega)
+        M = sp.csr_array(M)
+
+        def varre(x,r):
+            x += spsolve_triangular(M,r,lower=True)
+
+    return varre
+
+
+def gauss_seidel_csr(A,b,x0=None,tol=1e-8,nit=1000,historico=None):
+    """
+    Metodo de Gauss-Seidel para Ax = b com A esparsa (CSR), sem formar
+    a matriz de iteracao C. A varredura e compilada (numba) ou, na falta
+    deste, feita como (D+L) dx = b - Ax por substituicao esparsa.
+
+    entrada:
+          A - matriz n x n (densa ou scipy.sparse)
+          b - vetor n (ou coluna n x 1)
+         x0 - ponto de partida (vetor n; None = zeros)
+        tol - tolerancia do residuo relativo ||b - Ax||/||b||
+        nit - numero maximo de iteracoes
+  historico - None (apenas o vetor corrente e mantido), 'residuo'
+              (normas dos residuos) ou k (cada k-esima iterada)
+
+    saida:
+
+          x - vetor solucao, com a forma de b
+          k - iteracoes realizadas
+        res - residuo relativo final
+       hist - historico (apenas se historico nao for None)
+    """
+
+    A, d, b, x, forma = _prepara_csr(A,b,x0)
+
+    return _itera(_varredura_sor(A,b,1.0),A,b,x,tol,nit,historico,forma)
+
+
+def estima_omega(A):
+    """
+    Estima o parametro otimo do SOR, omega = 2/(1 + sqrt(1 - rho^2)),
+    sendo rho o raio espectral da matriz de iteracao de Jacobi
+    (exato para matrizes consistentemente ordenadas, e.g. Poisson),
+    calculado por autovalores densos se n <= 200 e pelo ARPACK acima.
+
+    entrada:
+          A - matriz n x n (densa ou scipy.sparse)
+
+    saida:
+
+      omega - parametro de relaxacao (1 se rho >= 1)
+    """
+
+    A = sp.csr_array(A)
+    d = A.diagonal()
+
+    # sistemas pequenos: autovalores densos (o ARPACK exige k < n-1)
+    if A.shape[0] <= 200:
+        C = np.eye(A.shape[0]) - A.toarray()/d[:,None]
+        rho = np.abs(np.linalg.eigvals(C)).max()
+        return 1.0 if rho >= 1 else 2/(1 + np.sqrt(1 - rho**2))
+
+    C = sp.linalg.LinearOperator(A.shape,matvec=lambda v: v - (A @ v)/d,
+                                 dtype=A.dtype)
+    try:
+        rho = np.abs(eigs(C,k=1,which='LM',tol=1e-4,
+                          return_eigenvectors=False)[0])
+    except ArpackNoConvergence as err:
+        rho = np.abs(err.eigenvalues).max() if err.eigenvalues.size else 1.0
+
+    if rho >= 1:
+        return 1.0
+    return 2/(1 + np.sqrt(1 - rho**2))
+
+
+def sor_csr(A,b,x0=None,tol=1e-8,nit=1000,omega=None,historico=None):
+    """
+    Metodo SOR (sobrerrelaxacao sucessiva) para Ax = b com A esparsa.
+
+    entrada:
+          A - matriz n x n (densa ou scipy.sparse)
+          b - vetor n (ou coluna n x 1)
+         x0 - ponto de partida (vetor n; None = zeros)
+        tol - tolerancia do residuo relativo ||b - Ax||/||b||
+        nit - numero maximo de iteracoes
+      omega - relaxacao em (0,2); None estima o otimo (estima_omega)
+  historico - None, 'residuo' ou k (ver MonitorConvergencia)
+
+    saida:
+
+          x - vetor solucao, com a forma de b
+          k - iteracoes realizadas
+        res - residuo relativo final
+       hist - historico (apenas se historico nao for None)
+    """
+
+    A, d, b, x, forma = _prepara_csr(A,b,x0)
+    omega = estima_omega(A) if omega is None else omega
+    if not 0 < omega < 2:
+        raise ValueError('omega deve estar em (0,2).')
+
+    return _itera(_varredura_sor(A,b,omega),A,b,x,tol,nit,historico,forma)
+
+
+def _precondicionador(A,d,tipo,omega):
+    """
+    Retorna z = M^{-1} r para o precondicionador escolhido:
+    None (identidade), 'jacobi' (M = D) ou 'ssor'
+    (M = omega/(2-omega) (D/omega + L) (D/omega)^{-1} (D/omega + U)).
+    """
+
+    if tipo is None:
+        return lambda r: r
+    if tipo == 'jacobi':
+        return lambda r: r/d
+    if tipo == 'ssor':
+        if not 0 < omega < 2:
+            raise ValueError('omega deve estar em (0,2).')
+        Dw = sp.diags_array(d/omega)
+        Mi = sp.csr_array(sp.tril(A,-1) + Dw)
+        Ms = sp.csr_array(sp.triu(A,1) + Dw)
+        c = (2 - omega)/omega
+
+        def aplica(r):
+            y = spsolve_triangular(Mi,r,lower=True)
+            return c*spsolve_triangular(Ms,(d/omega)*y,lower=False)
+
+        return aplica
+    raise ValueError("precond deve ser None, 'jacobi' ou 'ssor'.")
+
+
+def gc_csr(A,b,x0=None,tol=1e-8,nit=1000,precond='ssor',omega=1.0,
+           historico=None):
+    """
+    Metodo dos gradientes conjugados precondicionado para Ax = b,
+    A simetrica positiva definida (esparsa).
+
+    entrada:
+          A - matriz n x n simetrica positiva definida
+          b - vetor n (ou coluna n x 1)
+         x0 - ponto de partida (vetor n; None = zeros)
+        tol - tolerancia do residuo relativo ||b - Ax||/||b||
+        nit - numero maximo de iteracoes
+    precond - None, 'jacobi' ou 'ssor'
+      omega - relaxacao do SSOR, em (0,2)
+  historico - None, 'residuo' ou k (ver MonitorConvergencia)
+
+    saida:
+
+          x - vetor solucao, com a forma de b
+          k - iteracoes realizadas
+        res - residuo relativo final
+       hist - historico (apenas se historico nao for None)
+    """
+
+    A, d, b, x, forma = _prepara_csr(A,b,x0)
+    M = _precondicionador(A,d,precond,omega)
+    monitor = MonitorConvergencia(b,tol,nit,historico,forma)
+
+    r = b - A @ x
+    z = M(r)
+    p = z.copy()
+    rz = r @ z
+
+    k = 0
+    while not monitor(k,x,np.linalg.norm(r)):
+        Ap = A @ p
+        alfa = rz/(p @ Ap)
+        x += alfa*p
+        r -= alfa*Ap
+
+        z = M(r)
+        rz, rz_ant = r @ z, rz
+        p *= rz/rz_ant
+        p += z
+        k += 1
+
+    return monitor.resultado(x)
+
+
+def gmres_csr(A,b,x0=None,tol=1e-8,nit=1000,m=30,precond=None,omega=1.0,
+              historico=None):
+    """
+    Metodo GMRES reiniciado a cada m iteracoes (GMRES(m)), com
+    precondicionamento a direita, para Ax = b com A esparsa geral.
+
+    entrada:
+          A - matriz n x n (densa ou scipy.sparse)
+          b - vetor n (ou coluna n x 1)
+         x0 - ponto de partida (vetor n; None = zeros)
+        tol - tolerancia do residuo relativo ||b - Ax||/||b||
+        nit - numero maximo de iteracoes (total, somando os ciclos)
+          m - dimensao do subespaco de Krylov antes de reiniciar
+    precond - None, 'jacobi' ou 'ssor'
+      omega - relaxacao do SSOR, em (0,2)
+  historico - None, 'residuo' ou k (ver MonitorConvergencia);
+              as iteradas so existem ao fim de cada ciclo
+
+    saida:
+
+          x - vetor solucao, com a forma de b
+          k - iteracoes realizadas
+        res - residuo relativo final
+       hist - historico (apenas se historico nao for None)
+    """
+
+    A, d, b, x, forma = _prepara_csr(A,b,x0)
+    M = _precondicionador(A,d,precond,omega)
+    monitor = MonitorConvergencia(b,tol,nit,historico,forma)
+
+    n = b.size
+    V = np.empty((m+1,n),dtype=b.dtype)
+    H = np.zeros((m+1,m),dtype=b.dtype)
+    cs, sn = np.zeros(m), np.zeros(m)
+    g = np.zeros(m+1)
+
+    r = b - A @ x
+    beta = np.linalg.norm(r)
+    k = 0
+    parar = monitor(k,x,beta)
+
+    while not parar:
+        H[:] = 0
+        g[:] = 0
+        g[0] = beta
+        V[0] = r/beta
+
+        for j in range(m):
+            # Arnoldi (Gram-Schmidt modificado)
+            w = A @ M(V[j])
+            for i in range(j+1):
+                H[i,j] = w @ V[i]
+                w -= H[i,j]*V[i]
+            H[j+1,j] = np.linalg.norm(w)
+            if H[j+1,j] != 0:
+                V[j+1] = w/H[j+1,j]
+
+            # rotações de Givens anteriores e a nova, em H[:,j] e g
+            for i in range(j):
+                H[i,j], H[i+1,j] = (cs[i]*H[i,j] + sn[i]*H[i+1,j],
+                                    -sn[i]*H[i,j] + cs[i]*H[i+1,j])
+            den = np.hypot(H[j,j],H[j+1,j])
+            cs[j], sn[j] = H[j,j]/den, H[j+1,j]/den
+            H[j,j], H[j+1,j] = den, 0
+            g[j+1] = -sn[j]*g[j]
+            g[j] = cs[j]*g[j]
+
+            k += 1
+            parar = monitor(k,None,abs(g[j+1]))
+            if parar or g[j+1] == 0:
+                break
+
+        # atualiza x com a solução do problema de mínimos quadrados
+        y = subst_regressiva(H[:j+1,:j+1],g[:j+1])
+        x += M(V[:j+1].T @ y)
+
+        # resíduo verdadeiro ao fim do ciclo
+        r = b - A @ x
+        beta = np.linalg.norm(r)
+        parar = monitor(k,x,beta)
+
+    return monitor.resultado(x)
+
+
+if __name__ == '__main__':
+    None
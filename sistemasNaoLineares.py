@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Metodos para solucao de sistemas nao lineares F(x) = 0.
+"""
+
+from functools import lru_cache
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+from sistemasLineares import FatoracaoLU
+
+# sympy é importado sob demanda, apenas nos caminhos simbólicos
+
+__all__ = ['jacobian', 'compila_sistema', 'newtonnaolin', 'colore_colunas',
+           'jacobiana_num', 'newton_sistema']
+
+
+def jacobian(F,Xs):
+    """
+    Matriz jacobiana simbolica de F em relacao a Xs.
+
+    entrada:
+          F - vetor (sy.Matrix) com as equacoes do sistema
+         Xs - vetor (sy.Matrix) com as variaveis do sistema
+
+    saida:
+
+          J - matriz jacobiana (simbolica)
+    """
+
+    import sympy as sy
+
+    return sy.Matrix(F).jacobian(sy.Matrix(Xs))
+
+
+@lru_cache(maxsize=64)
+def _compila(F,Xs):
+    """
+    Compila (F, J) para funcoes numpy, com eliminacao de subexpressoes
+    comuns; F e Xs imutaveis servem de chave do cache.
+    """
+
+    import sympy as sy
+
+    J = jacobian(F,Xs)
+    Fn = sy.lambdify([list(Xs)],F,modules='numpy',cse=True)
+    Jn = sy.lambdify([list(Xs)],J,modules='numpy',cse=True)
+
+    return Fn, Jn
+
+
+def compila_sistema(F,Xs):
+    """
+    Converte o sistema simbolico F(Xs) em funcoes numericas, uma unica
+    vez por sistema (cache): cada chamada seguinte apenas avalia floats.
+
+    entrada:
+          F - vetor (sy.Matrix ou lista) com as equacoes do sistema
+         Xs - vetor (sy.Matrix ou lista) com as variaveis do sistema
+
+    saida:
+
+         Fn - funcao Fn(x) -> array (n x 1)
+         Jn - funcao Jn(x) -> array (n x n), a jacobiana de F
+    """
+
+    import sympy as sy
+
+    return _compila(sy.ImmutableMatrix(F),sy.ImmutableMatrix(Xs))
+
+
+def _erro_relativo(X,Xp):
+    """
+    Erro relativo na componente de maior variacao absoluta.
+    """
+
+    EA = np.abs(X - Xp)
+    i = np.argmax(EA)
+    return np.abs(EA[i]/X[i])
+
+
+def newtonnaolin(F,Xs,ER,X0,nit=100):
+    """
+    Metodo de Newton para o sistema nao linear F(Xs) = 0. A jacobiana
+    simbolica e compilada uma vez (compila_sistema), e cada iteracao
+    usa apenas aritmetica de ponto flutuante.
+
+    entrada:
+          F - vetor (sy.Matrix) com as equacoes do sistema
+         Xs - vetor (sy.Matrix) com as variaveis do sistema
+         ER - erro relativo (forma decimal) entre iteracoes
+         X0 - estimativa inicial
+        nit - numero maximo de iteracoes
+
+    saida:
+
+          X - vetor solucao
+    """
+
+    Fn, Jn = compila_sistema(F,Xs)
+
+    X = np.array(X0,dtype=float).ravel()
+    erro = 1
+    k = 0
+
+    while erro > ER and k < nit:
+        Xp = X.copy()
+
+        A = np.asarray(Jn(X),dtype=float)
+        B = np.asarray(Fn(X),dtype=float).ravel()
+
+        X -= np.linalg.solve(A,B)
+
+        erro = _erro_relativo(X,Xp)
+        k += 1
+
+    return X
+
+
+def colore_colunas(padrao):
+    """
+    Agrupa as colunas de um padrao de esparsidade de modo que colunas
+    do mesmo grupo nao compartilhem linhas (coloracao gulosa do grafo
+    de intersecao de colunas, Curtis-Powell-Reid).
+
+    entrada:
+     padrao - matriz (m x n) cujos nao nulos marcam J[i,j] != 0
+
+    saida:
+
+     grupos - grupo (cor) de cada coluna, array de int (n,)
+    """
+
+    S = sp.csc_array(padrao,dtype=float)
+    S.data[:] = 1
+    G = sp.csr_array(S.T @ S)
+
+    n = G.shape[0]
+    grupos = np.full(n,-1)
+    for j in range(n):
+        viz = grupos[G.indices[G.indptr[j]:G.indptr[j+1]]]
+        usadas = np.zeros(viz.size+1,dtype=bool)
+        usadas[viz[(viz >= 0) & (viz <= viz.size)]] = True
+        grupos[j] = np.argmin(usadas)
+
+    return grupos
+
+
+def jacobiana_num(F,x,metodo='central',padrao=None,vetorizada=False,
+                  F0=None,grupos=None):
+    """
+    Jacobiana de F em x por diferencas finitas ou passo complexo,
+    perturbando grupos de colunas independentes simultaneamente
+    quando o padrao de esparsidade e conhecido.
+
+    entrada:
+          F - funcao F(x) -> array (m,), x array (n,)
+          x - ponto de avaliacao (n,)
+     metodo - 'progressiva', 'central' ou 'complexa' (passo complexo;
+              F deve aceitar numeros complexos)
+     padrao - padrao de esparsidade (m x n) ou None (jacobiana densa)
+ vetorizada - se True, F aceita X (n x k) e retorna (m x k)
+         F0 - F(x), se ja disponivel (poupa uma avaliacao na progressiva)
+     grupos - coloracao do padrao ja calculada (ver colore_colunas)
+
+    saida:
+
+          J - jacobiana (m x n): array, ou scipy.sparse CSR se houver padrao
+    """
+
+    x = np.asarray(x,dtype=float).ravel()
+    n = x.size
+
+    if padrao is None:
+        grupos = np.arange(n)
+    else:
+        S = sp.coo_array(padrao)
+        if grupos is None:
+            grupos = colore_colunas(S)
+    ng = grupos.max() + 1
+
+    # passos por coluna e direções de perturbação (uma por grupo)
+    eps = np.finfo(float).eps
+    if metodo == 'progressiva':
+        h = np.sqrt(eps)*np.maximum(1,np.abs(x))
+    elif metodo == 'central':
+        h = eps**(1/3)*np.maximum(1,np.abs(x))
+    elif metodo == 'complexa':
+        h = np.full(n,1e-20)
+    else:
+        raise ValueError("metodo deve ser 'progressiva', 'central' ou 'complexa'.")
+    E = np.zeros((n,ng))
+    E[np.arange(n),grupos] = h
+
+    def avalia(X):
+        if vetorizada:
+            return np.asarray(F(X))
+        return np.column_stack([np.asarray(F(X[:,g]))
+                                for g in range(X.shape[1])])
+
+    X = x[:,None]
+    if metodo == 'progressiva':
+        if F0 is None:
+            F0 = np.asarray(F(x))
+        D = avalia(X + E) - np.asarray(F0).reshape(-1,1)
+    elif metodo == 'central':
+        D = (avalia(X + E) - avalia(X - E))/2
+    else:
+        D = avalia(X + 1j*E).imag
+
+    if padrao is None:
+        return D/h
+
+    lin, col = S.row, S.col
+    return sp.csr_array((D[lin,grupos[col]]/h[col],(lin,col)),shape=S.shape)
+
+
+def _fatora(A):
+    """
+    Fatora A (densa: FatoracaoLU; esparsa: splu) e retorna a funcao
+    que resolve A x = b com a fatoracao.
+    """
+
+    if sp.issparse(A):
+        return splu(sp.csc_array(A)).solve
+    return FatoracaoLU(A).resolve
+
+
+def newton_sistema(F,X0,ER,J=None,nit=100,modo='newton',rho=0.5,info=False,
+                   **opcoes):
+    """
+    Metodo de Newton para F(x) = 0 com F numerica (caixa-preta), com
+    variantes quase-Newton que reaproveitam a fatoracao LU da jacobiana:
+
+        'newton'  - jacobiana nova e fatorada a cada iteracao
+        'corda'   - reutiliza a LU de uma jacobiana antiga
+        'broyden' - corrige a inversa com atualizacoes de posto 1
+                    (forma produto, sobre a LU antiga)
+
+    Nos modos 'corda' e 'broyden' a jacobiana so e recalculada quando a
+    convergencia estagna, i.e., ||F(x_k+1)|| > rho*||F(x_k)||. Rho menor
+    aproxima o metodo de Newton (mais fatoracoes, menos iteracoes); rho
+    maior fatora menos, com convergencia linear mais lenta. Longe da
+    solucao, a corda pode precisar de mais fatoracoes que o proprio
+    Newton: compare as contagens de info com as de modo='newton'.
+
+    entrada:
+          F - funcao F(x) -> array (n,)
+         X0 - estimativa inicial
+         ER - erro relativo (forma decimal) entre iteracoes
+          J - funcao J(x) -> jacobiana (n x n), ou None (jacobiana_num)
+        nit - numero maximo de iteracoes
+       modo - 'newton', 'corda' ou 'broyden'
+        rho - fator de estagnacao que provoca nova jacobiana
+       info - se True, retorna tambem as contagens
+     opcoes - argumentos de jacobiana_num (metodo, padrao, vetorizada)
+
+    saida:
+
+          X - vetor solucao
+       info - dict com iteracoes, fatoracoes e
+              iteracoes_sem_fatoracao (iteracoes que reutilizaram a LU)
+    """
+
+    if modo not in ('newton','corda','broyden'):
+        raise ValueError("modo deve ser 'newton', 'corda' ou 'broyden'.")
+
+    X = np.array(X0,dtype=float).ravel()
+    erro = 1
+    k = 0
+
+    # a coloração do padrão é feita uma única vez
+    if J is None and opcoes.get('padrao') is not None:
+        opcoes.setdefault('grupos',colore_colunas(opcoes['padrao']))
+
+    B = np.asarray(F(X),dtype=float).ravel()
+    nB = np.linalg.norm(B)
+    resolve = None
+    atualizacoes = []
+    fatoracoes = 0
+
+    def aplica(v):
+        # H v = (I + c s^T)...(I + c0 s0^T) J0^{-1} v
+        z = resolve(v)
+        for c, s in atualizacoes:
+            z += c*(s @ z)
+        return z
+
+    while erro > ER and k < nit:
+        if resolve is None or modo == 'newton':
+            A = J(X) if J is not None else jacobiana_num(F,X,F0=B,**opcoes)
+            resolve = _fatora(A)
+            atualizacoes = []
+            fatoracoes += 1
+
+        Xp = X.copy()
+        dX = -aplica(B)
+        X += dX
+
+        Bn = np.asarray(F(X),dtype=float).ravel()
+        nBn = np.linalg.norm(Bn)
+
+        if modo != 'newton' and nBn > rho*nB:
+            # convergência estagnou: nova jacobiana na próxima iteração
+            resolve = None
+        elif modo == 'broyden':
+            # atualização de Broyden ("boa") da inversa
+            Hy = aplica(Bn - B)
+            den = dX @ Hy
+            if den != 0:
+                atualizacoes.append(((dX - Hy)/den,dX))
+            else:
+                resolve = None
+
+        B, nB = Bn, nBn
+        erro = _erro_relativo(X,Xp)
+        k += 1
+
+    if info:
+        return X, {'iteracoes': k, 'fatoracoes': fatoracoes,
+                   'iteracoes_sem_fatoracao': k - fatoracoes}
+    return X
+
+
+if __name__ == '__main__':
+    None